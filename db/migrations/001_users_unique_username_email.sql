@@ -0,0 +1,18 @@
+-- Unique usernames and emails for quiz_pengupil.users
+--
+-- login.php looks users up by username and register.php inserts without a
+-- reliable duplicate check, so without these keys every login is a full
+-- table scan and two accounts can share a username or an email.
+--
+-- The keys use the column collation (utf8mb4_general_ci): 'Irul' and
+-- 'irul ' collide with 'irul'. Remove such duplicates before running:
+--
+--   SELECT LOWER(TRIM(TRAILING ' ' FROM username)) AS u, COUNT(*) FROM users GROUP BY u HAVING COUNT(*) > 1;
+--   SELECT LOWER(TRIM(TRAILING ' ' FROM email)) AS e, COUNT(*) FROM users GROUP BY e HAVING COUNT(*) > 1;
+--
+-- db/quiz_pengupil.sql already creates the table with these keys; this file
+-- is for databases imported from an older dump.
+
+ALTER TABLE `users`
+  ADD UNIQUE KEY `uniq_users_username` (`username`),
+  ADD UNIQUE KEY `uniq_users_email` (`email`);
@@ -4,8 +4,22 @@
     $password = '';                  
     $db       = 'quiz_pengupil';
 
-    $con = mysqli_connect($host, $user, $password, $db);
-    if (!$con) { 
-        die("Connection failed: " . mysqli_connect_error());    
+    // Copied now: the pages reuse $password/$user for form fields
+    define('DB_CONFIG', array('p:' . $host, $user, $password, $db));
+
+    /*
+     * The page's connection, opened on first use so GET requests never
+     * connect. The "p:" host makes it persistent: the PHP worker keeps it
+     * open and hands it to the next request instead of reconnecting.
+     */
+    function db() {
+        static $con = null;
+        if ($con === null) {
+            $con = mysqli_connect(DB_CONFIG[0], DB_CONFIG[1], DB_CONFIG[2], DB_CONFIG[3]);
+            if (!$con) { 
+                die("Connection failed: " . mysqli_connect_error());    
+            }
+        }
+        return $con;
     }
-?>
\ No newline at end of file
+?>
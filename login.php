@@ -9,20 +9,23 @@ $validate = '';
 if( isset($_SESSION['username']) ) header('Location: index.php');
 
 if( isset($_POST['submit']) ){
+        $con = db();
         
         $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
         $password = stripslashes($_POST['password']);
         $password = mysqli_real_escape_string($con, $password);
        
         if(!empty(trim($username)) && !empty(trim($password))){
 
-            $query      = "SELECT * FROM users WHERE username = '$username'";
-            $result     = mysqli_query($con, $query);
-            $rows       = mysqli_num_rows($result);
+            // Only the hash, at most one row, found through the unique username index
+            $stmt       = mysqli_prepare($con, "SELECT password FROM users WHERE username = ? LIMIT 1");
+            mysqli_stmt_bind_param($stmt, 's', $username);
+            mysqli_stmt_execute($stmt);
+            mysqli_stmt_bind_result($stmt, $hash);
+            $found      = mysqli_stmt_fetch($stmt);
+            mysqli_stmt_close($stmt);
 
-            if ($rows != 0) {
-                $hash   = mysqli_fetch_assoc($result)['password'];
+            if ($found) {
                 if(password_verify($password, $hash)){
                     $_SESSION['username'] = $username;
                
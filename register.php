@@ -16,6 +16,7 @@ $error = '';
 $validate = '';
 if( isset($_SESSION['user']) ) header('Location: index.php');
 if( isset($_POST['submit']) ){
+        $con = db();
         
         $username = stripslashes($_POST['username']);
         $username = mysqli_real_escape_string($con, $username);
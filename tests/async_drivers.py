@@ -0,0 +1,138 @@
+"""
+asyncio counterparts of LoginDriver/RegisterDriver for concurrency tests.
+
+One driver serves any number of simulated clients: each client is a
+`ClientSession` (its own PHP `$_SESSION`), and the users table is reached
+through an async store, so thousands of concurrent logins and registrations
+can run on one event loop against a shared stub.
+
+    store = AsyncMemoryStore(DatabaseStub(), latency=0.001)
+    register = AsyncRegisterDriver(store, cost=4)
+    results = await asyncio.gather(*(register.attempt_register(ClientSession(), ...)
+                                     for _ in range(1000)))
+
+An async store implements:
+
+    await get_user(username)      user record or None
+    await get_password_hash(username)
+                                  password hash or None (the login lookup)
+    await user_exists(username)   bool
+    await add_user(username, name, email, password_hash)
+                                  False when the username or email exists; the check
+                                  and the insert are one atomic step
+
+`latency` is awaited before every store operation, like a database round
+trip, so other clients run between a driver's separate calls (the window in
+which a check-then-insert race would happen).
+"""
+import asyncio
+
+from database_stub import DatabaseStub
+from passwords import DEFAULT_COST, VERIFIER, password_hash
+from stub_server import ERROR_DUPLICATE, ERROR_EMPTY, ERROR_FAILED, VALIDATE_MISMATCH
+
+
+class ClientSession:
+    """Session of one simulated client"""
+    def __init__(self):
+        self.data = {}
+
+    @property
+    def username(self):
+        return self.data.get('username')
+
+    def is_logged_in(self):
+        return 'username' in self.data
+
+    def logout(self):
+        self.data.clear()
+
+
+class AsyncMemoryStore:
+    """Async store over a DatabaseStub (or a fork of one)"""
+    def __init__(self, db=None, latency=0.0):
+        self.db = db if db is not None else DatabaseStub()
+        self.latency = latency
+
+    async def _round_trip(self):
+        # sleep(0) still yields to the other clients
+        await asyncio.sleep(self.latency)
+
+    async def get_user(self, username):
+        await self._round_trip()
+        return self.db.get_user(username)
+
+    async def get_password_hash(self, username):
+        await self._round_trip()
+        return self.db.get_password_hash(username)
+
+    async def user_exists(self, username):
+        await self._round_trip()
+        return self.db.user_exists(username)
+
+    async def add_user(self, username, name, email, password_hash):
+        await self._round_trip()
+        return self.db.add_user(username, name, email, password_hash)
+
+
+def _filled(value):
+    return bool(value and value.strip())
+
+
+class AsyncLoginDriver:
+    """login.php for many concurrent clients"""
+    def __init__(self, store, verifier=None):
+        self.store = store
+        self.verifier = verifier or VERIFIER
+
+    async def _verify(self, password, hashed):
+        result = self.verifier.cached(password, hashed)
+        if result is None:
+            # bcrypt releases the GIL; keep it off the event loop
+            result = await asyncio.to_thread(self.verifier.verify, password, hashed)
+        return result
+
+    async def attempt_login(self, session, username, password):
+        """Returns: dict with 'success', 'error', 'redirect' keys"""
+        if not _filled(username) or not _filled(password):
+            return {'success': False, 'error': ERROR_EMPTY, 'redirect': None}
+
+        hashed = await self.store.get_password_hash(username)
+        if hashed is None:
+            return {'success': False, 'error': ERROR_FAILED, 'redirect': None}
+
+        # Wrong password: login.php sets no error and does not redirect
+        if not await self._verify(password, hashed):
+            return {'success': False, 'error': None, 'redirect': None}
+
+        session.data['username'] = username
+        return {'success': True, 'error': None, 'redirect': 'index.php'}
+
+
+class AsyncRegisterDriver:
+    """
+    register.php for many concurrent clients, including its bugs: the
+    duplicate check looks at `name`, and the name is stored empty.
+    `cost` is the bcrypt cost of stored passwords.
+    """
+    def __init__(self, store, cost=DEFAULT_COST):
+        self.store = store
+        self.cost = cost
+
+    async def attempt_register(self, session, name, email, username, password, repassword):
+        """Returns: dict with 'success', 'error', 'validate', 'redirect' keys"""
+        if not all(_filled(f) for f in (name, email, username, password, repassword)):
+            return {'success': False, 'error': ERROR_EMPTY, 'validate': None, 'redirect': None}
+
+        if password != repassword:
+            return {'success': False, 'error': None, 'validate': VALIDATE_MISMATCH, 'redirect': None}
+
+        if await self.store.user_exists(name):
+            return {'success': False, 'error': ERROR_DUPLICATE, 'validate': None, 'redirect': None}
+
+        hashed = await asyncio.to_thread(password_hash, password, self.cost)
+        if not await self.store.add_user(username, '', email, hashed):
+            return {'success': False, 'error': ERROR_FAILED, 'validate': None, 'redirect': None}
+
+        session.data['username'] = username
+        return {'success': True, 'error': None, 'validate': None, 'redirect': 'index.php'}
@@ -0,0 +1,81 @@
+"""
+Throughput of the async drivers at 1, 100 and 10,000 concurrent clients.
+
+    python tests/benchmarks/bench_async_drivers.py [--logins 20000] [--registrations 2000]
+                                                   [--latency 0.0005] [--users 100000]
+
+Every client is a coroutine with its own ClientSession running its share of
+the operations back to back; all clients share one AsyncMemoryStore over a
+DatabaseStub preloaded with synthetic users. Logins mix valid, wrong-password
+and unknown-user attempts (bcrypt results cached, as for repeated test
+credentials); registrations use unique usernames at bcrypt cost 4.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_drivers import AsyncLoginDriver, AsyncMemoryStore, AsyncRegisterDriver, ClientSession  # noqa: E402
+from database_stub import DatabaseStub  # noqa: E402
+from user_generator import SyntheticUsers  # noqa: E402
+
+CONCURRENCY = (1, 100, 10_000)
+
+
+async def run_clients(clients, operations, operation):
+    """Run `operations` calls of `operation(session, i)` over `clients` coroutines"""
+    async def client(worker):
+        session = ClientSession()
+        for i in range(worker, operations, clients):
+            await operation(session, i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(worker) for worker in range(min(clients, operations))))
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20_000)
+    parser.add_argument("--registrations", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds awaited per store operation (simulated round trip)")
+    parser.add_argument("--users", type=int, default=10_000, help="Synthetic users preloaded")
+    args = parser.parse_args()
+
+    users = SyntheticUsers(args.users, cost=4)
+    base = DatabaseStub()
+    base.bulk_load(users)
+    credentials = [(users.username_for(i), users.plaintext(i)) for i in range(min(args.users, 100))]
+
+    print(f"{len(base)} users, store latency {args.latency * 1000:.2f}ms")
+    print(f"{'clients':>8} {'login ops/s':>12} {'register ops/s':>15}")
+    for clients in CONCURRENCY:
+        db = base.fork()
+        store = AsyncMemoryStore(db, latency=args.latency)
+        login = AsyncLoginDriver(store)
+        register = AsyncRegisterDriver(store, cost=4)
+
+        async def log_in(session, i):
+            username, password = credentials[i % len(credentials)]
+            if i % 3 == 1:
+                password += 'x'
+            elif i % 3 == 2:
+                username = f"missing{i}"
+            await login.attempt_login(session, username, password)
+
+        async def sign_up(session, i):
+            username = f"bench{clients}r{i}"
+            await register.attempt_register(session, "Bench User", f"{username}@example.com",
+                                            username, "BenchPass1", "BenchPass1")
+
+        login_rate = asyncio.run(run_clients(clients, args.logins, log_in))
+        register_rate = asyncio.run(run_clients(clients, args.registrations, sign_up))
+        print(f"{clients:>8} {login_rate:>12,.0f} {register_rate:>15,.0f}")
+
+
+if __name__ == '__main__':
+    main()
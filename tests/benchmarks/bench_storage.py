@@ -0,0 +1,62 @@
+"""
+Lookup and insert throughput of the storage backends at scale.
+
+    python tests/benchmarks/bench_storage.py [--users 100000] [--lookups 20000]
+                                             [--backends memory sqlite] [--sqlite-file users.db]
+
+Loads the same synthetic users into each backend, then times get_user() for
+a mix of existing and missing usernames (what login.php does) and add_user()
+for new ones (what register.php does).
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import BACKENDS, open_store  # noqa: E402
+from user_generator import SyntheticUsers  # noqa: E402
+
+
+def timed(fn, args):
+    start = time.perf_counter()
+    for arg in args:
+        fn(*arg)
+    return len(args) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--inserts", type=int, default=2_000)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=['memory', 'sqlite'])
+    parser.add_argument("--sqlite-file", help="Use this SQLite file instead of :memory:")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    users = SyntheticUsers(args.users, cost=4)
+    rng = random.Random(args.seed)
+    lookups = [(users.username_for(rng.randrange(args.users)) if i % 2 else f"missing{i}",)
+               for i in range(args.lookups)]
+    inserts = [(f"bench{i:07d}", '', f"bench{i:07d}@example.com", '$2y$04$' + 'x' * 53)
+               for i in range(args.inserts)]
+
+    print(f"{args.users} users, {args.lookups} lookups, {args.inserts} inserts")
+    print(f"{'backend':<8} {'load s':>8} {'get_user/s':>12} {'add_user/s':>12}")
+    for backend in args.backends:
+        options = {'path': args.sqlite_file} if backend == 'sqlite' and args.sqlite_file else {}
+        store = open_store(backend, **options)
+        start = time.perf_counter()
+        store.bulk_load(users)
+        load = time.perf_counter() - start
+        get_rate = timed(store.get_user, lookups)
+        add_rate = timed(store.add_user, inserts)
+        print(f"{backend:<8} {load:>8.2f} {get_rate:>12,.0f} {add_rate:>12,.0f}")
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Username lookup latency before and after the UNIQUE indexes of
+db/migrations/001_users_unique_username_email.sql.
+
+    python tests/benchmarks/bench_user_index.py [--sizes 10000 100000 1000000]
+                                                [--lookups 2000] [--sqlite-file users.db]
+
+For each table size, SQLite is loaded without the indexes (the table before
+the migration) and get_user() is timed for a mix of existing and missing
+usernames, the query login.php makes; then create_indexes() runs and the
+lookups are timed again. A scan costs O(users), so scans are timed on
+--lookups scaled down to 10,000 users (at least 20). The memory stub, which is always keyed on the
+normalised username, is listed for reference.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_stub import DatabaseStub  # noqa: E402
+from storage import SQLiteStore  # noqa: E402
+from user_generator import SyntheticUsers  # noqa: E402
+
+
+def latencies(fn, args):
+    """Per-call latency in microseconds: (median, p99)"""
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--sqlite-file", help="Use this SQLite file (recreated per size) instead of :memory:")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{args.lookups} lookups per row, latency in us (median / p99)")
+    print(f"{'users':>9} {'sqlite scan':>20} {'sqlite index':>16} {'index s':>8} {'memory':>12}")
+    for size in args.sizes:
+        users = SyntheticUsers(size, cost=4)
+        lookups = [users.username_for(rng.randrange(size)) if i % 2 else f"missing{i}"
+                   for i in range(args.lookups)]
+
+        path = args.sqlite_file or ':memory:'
+        if path != ':memory:' and os.path.exists(path):
+            os.remove(path)
+        store = SQLiteStore(path, users=users, indexes=False)
+        scans = max(20, args.lookups * 10_000 // size)
+        before = latencies(store.get_user, lookups[:scans])
+        start = time.perf_counter()
+        store.create_indexes()
+        build = time.perf_counter() - start
+        after = latencies(store.get_user, lookups)
+        store.close()
+
+        db = DatabaseStub(users=())
+        db.bulk_load(users)
+        memory = latencies(db.get_user, lookups)
+        print(f"{size:>9,} {before[0]:>9.1f} / {before[1]:>8.1f} {after[0]:>7.1f} / {after[1]:>6.1f}"
+              f" {build:>8.2f} {memory[0]:>5.1f} / {memory[1]:>4.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Memory per user in DatabaseStub: plain dict records vs UserRecord.
+
+    python tests/benchmarks/bench_user_memory.py [--users 1000000]
+
+Builds the same synthetic users twice and reports the traced allocation per
+user, including the username index entry. Like SyntheticUsers, every user
+has its own name and one of a few password hashes; each record gets a fresh
+hash string, as rows parsed from SQL or a file do, so the interning of
+UserRecord.password is part of the measurement.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_stub import UserRecord  # noqa: E402
+
+HASH_PREFIX = '$2y$10$D9yc9Mt0t8niCNO9di8ejOUPib46suwHghqFnJRKQJ3Z6uwRDx'
+DISTINCT_PASSWORDS = 16
+
+
+def row(i):
+    """Fields of user `i`, all freshly built strings"""
+    return (i, f"Synthetic User {i}", f"user{i:07d}", f"user{i:07d}@example.com",
+            f"{HASH_PREFIX}{i % DISTINCT_PASSWORDS:05d}")
+
+
+def dict_record(i):
+    return dict(zip(UserRecord.FIELDS, row(i)))
+
+
+def slots_record(i):
+    return UserRecord(*row(i))
+
+
+def measure(make_record, count):
+    """Bytes allocated per user for `count` records indexed by username"""
+    gc.collect()
+    tracemalloc.start()
+    users = {}
+    for i in range(count):
+        record = make_record(i)
+        users[record['username']] = record
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del users
+    return current / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=200_000)
+    args = parser.parse_args()
+
+    before = measure(dict_record, args.users)
+    after = measure(slots_record, args.users)
+    print(f"{args.users} users")
+    print(f"dict records:  {before:7.1f} bytes/user")
+    print(f"UserRecord:    {after:7.1f} bytes/user  ({1 - after / before:.0%} less)")
+
+
+if __name__ == '__main__':
+    main()
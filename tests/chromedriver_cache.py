@@ -0,0 +1,33 @@
+"""
+Resolve the chromedriver executable without touching the network.
+
+`ChromeDriverManager().install()` performs a version lookup over the network
+on every call, which stalls on air-gapped runners, so the suite never
+downloads drivers. Resolution order:
+
+1. CHROMEDRIVER_PATH environment variable
+2. chromedriver found on PATH
+
+Both are cheap, so nothing is persisted between sessions: a changed PATH or
+driver is picked up by the next run. Within a process the result is
+memoized, since every worker creates several drivers.
+"""
+import functools
+import os
+import shutil
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver_path():
+    """Return the chromedriver path from CHROMEDRIVER_PATH or PATH"""
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path:
+        if not os.path.isfile(env_path):
+            raise RuntimeError(f"CHROMEDRIVER_PATH={env_path} is not a file")
+        return env_path
+
+    path = shutil.which('chromedriver')
+    if not path:
+        raise RuntimeError("chromedriver not found: set CHROMEDRIVER_PATH to its path or put it on PATH "
+                           "(the suite does not download drivers)")
+    return path
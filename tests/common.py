@@ -0,0 +1,60 @@
+"""
+Helpers shared by the test-support modules.
+
+CACHE_DIR and FileLock back the on-disk caches (bcrypt hashes of
+user_generator.py, parsed workbook cases) that parallel workers share;
+real_escape_string() is mysqli_real_escape_string() for the stub server
+and the generated SQL.
+"""
+import os
+import time
+
+CACHE_DIR = os.environ.get('PPL_QUIZ_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'ppl_quiz'))
+
+
+# ==================== CACHE ====================
+
+class FileLock:
+    """
+    Cross-platform lock based on exclusive creation of a lock file.
+    A lock older than `stale_after` seconds is assumed abandoned.
+    """
+    def __init__(self, path, timeout=60, stale_after=120):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire lock {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+# ==================== SQL ====================
+
+_ESCAPES = {'\0': '\\0', '\n': '\\n', '\r': '\\r', '\\': '\\\\', "'": "\\'", '"': '\\"', '\x1a': '\\Z'}
+
+
+def real_escape_string(value):
+    """mysqli_real_escape_string() for a utf8mb4 connection"""
+    return ''.join(_ESCAPES.get(ch, ch) for ch in value)
@@ -5,8 +5,23 @@ import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
 import os
+from requests.adapters import HTTPAdapter
+
+from chromedriver_cache import resolve_chromedriver_path
+from database_stub import DatabaseStub
+from driver_pool import DriverPool
+from form_cases import CaseRunner
+from form_client import AuthenticatedSession, BrowserFormClient, HttpFormClient
+from parallel import UniqueNames, assign_schedule_groups, worker_count, worker_screenshot_dir
+from storage import BACKENDS, open_store
+from stub_server import StubServer
+import passwords
+import screenshot_service
+import waits
+import workbook
+from timing import PHASES, TIMINGS
 
 # Configuration
 BASE_URL = os.environ.get('BASE_URL', 'http://localhost/fiz_quizppl')
@@ -15,9 +30,78 @@ SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "screenshots")
 # Create screenshot directory if not exists
 os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
+
+def pytest_addoption(parser):
+    """Command line options for the WebDriver pool"""
+    group = parser.getgroup("driver pool")
+    group.addoption("--driver-pool-size", type=int,
+                    default=int(os.environ.get('DRIVER_POOL_SIZE', 1)),
+                    help="Number of warm Chrome instances kept for the session (0 disables pooling)")
+    group.addoption("--driver-max-uses", type=int,
+                    default=int(os.environ.get('DRIVER_MAX_USES', 50)),
+                    help="Recycle a pooled Chrome instance after this many tests")
+
+    group = parser.getgroup("stub server")
+    group.addoption("--stub-server", action="store_true",
+                    default=bool(os.environ.get('STUB_SERVER')),
+                    help="Serve login.php/register.php from the in-process Python stand-in "
+                         "instead of BASE_URL (no PHP/MySQL needed)")
+    group.addoption("--db-backend", choices=BACKENDS,
+                    default=os.environ.get('DB_BACKEND', 'memory'),
+                    help="users table behind the stub server and the stub drivers: in-memory dicts, "
+                         "SQLite, or MySQL (MYSQL_HOST/MYSQL_USER/... like koneksi.php)")
+
+    group = parser.getgroup("form client")
+    group.addoption("--client-mode", choices=["browser", "http", "both"],
+                    default=os.environ.get('CLIENT_MODE', 'browser'),
+                    help="Run form_client tests through Chrome, plain HTTP, or both")
+
+    group = parser.getgroup("screenshots")
+    group.addoption("--screenshots", choices=screenshot_service.POLICIES,
+                    default=os.environ.get('SCREENSHOT_POLICY', 'all'),
+                    help="Screenshot capture policy (on-failure keeps the last captures "
+                         "in memory and writes them only for failing tests)")
+    group.addoption("--screenshot-sample-rate", type=float,
+                    default=float(os.environ.get('SCREENSHOT_SAMPLE_RATE', 0.1)),
+                    help="Fraction of tests captured with --screenshots=sampled")
+    group.addoption("--screenshot-buffer", type=int,
+                    default=int(os.environ.get('SCREENSHOT_BUFFER', 5)),
+                    help="Captures kept in memory per test with --screenshots=on-failure")
+    group.addoption("--screenshot-keep-runs", type=int,
+                    default=int(os.environ.get('SCREENSHOT_KEEP_RUNS', 5)),
+                    help="Number of runs whose screenshots are kept in tests/screenshots/objects")
+
+    group = parser.getgroup("timing")
+    group.addoption("--timing-report", default=os.environ.get('TIMING_REPORT'),
+                    help="Record per-test phase timings and write them to this .json or .csv file "
+                         "(one file per xdist worker)")
+    group.addoption("--timing-samples", type=int,
+                    default=int(os.environ.get('TIMING_SAMPLES', 200)),
+                    help="Logins per username measured by SECURITY_007 (each is a bcrypt verify; "
+                         "raise to e.g. 2000 to detect smaller leaks)")
+
+    group = parser.getgroup("workbook")
+    group.addoption("--workbook-results", action="store_true",
+                    default=bool(os.environ.get('WORKBOOK_RESULTS')),
+                    help="Write the outcome of every TC_LGN/TC_REG test as a new column "
+                         "in TestCase_Complete_81_Tests.xlsx")
+
+
+@pytest.fixture(scope="session")
+def stub_server(request):
+    """In-process stand-in for the PHP pages, backed by the --db-backend store"""
+    db = open_store(request.config.getoption("--db-backend"))
+    server = StubServer(db).start()
+    yield server
+    server.stop()
+    db.close()
+
+
 @pytest.fixture(scope="session")
-def base_url():
+def base_url(request):
     """Return the base URL for the application"""
+    if request.config.getoption("--stub-server"):
+        return request.getfixturevalue("stub_server").url
     return BASE_URL
 
 @pytest.fixture(scope="session")
@@ -25,10 +109,99 @@ def screenshot_dir():
     """Return the screenshot directory path"""
     return SCREENSHOT_DIR
 
-@pytest.fixture(scope="function")
-def driver():
+@pytest.fixture(scope="session")
+def unique_names():
+    """Generator of usernames/emails unique per run and per xdist worker"""
+    return UniqueNames()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize form_client/case_runner tests with the selected client mode(s)
+    and workbook_case tests with the rows of the test-case workbook
+    """
+    mode = metafunc.config.getoption("--client-mode")
+    modes = ["browser", "http"] if mode == "both" else [mode]
+    if 'form_client' in metafunc.fixturenames:
+        metafunc.parametrize("form_client", modes, indirect=True)
+    if 'case_runner' in metafunc.fixturenames:
+        metafunc.parametrize("case_runner", modes, indirect=True, scope="module")
+    if 'workbook_case' in metafunc.fixturenames:
+        params = []
+        for case, skip, xfail in workbook.load_workbook_cases():
+            marks = [pytest.mark.skip(reason=skip)] if skip else []
+            if xfail:
+                # Defect documented in the sheet's Status column
+                marks.append(pytest.mark.xfail(reason=xfail, strict=False))
+            params.append(pytest.param(case, id=case.id, marks=marks))
+        metafunc.parametrize("workbook_case", params)
+
+
+@pytest.fixture(scope="session")
+def http_adapter():
+    """Connection pool shared by every HTTP-mode form client"""
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture
+def form_client(request, base_url):
+    """Browser or HTTP client for the login/register forms (see --client-mode)"""
+    if request.param == "http":
+        client = HttpFormClient(base_url, adapter=request.getfixturevalue("http_adapter"))
+    else:
+        client = BrowserFormClient(request.getfixturevalue("driver"), base_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def case_runner(request, base_url, unique_names):
+    """
+    CaseRunner for table-driven cases, kept for the whole module so that
+    consecutive cases share the browser and the rendered form
     """
-    Create a Chrome WebDriver instance for each test function.
+    if request.param == "http":
+        client = HttpFormClient(base_url, adapter=request.getfixturevalue("http_adapter"))
+        yield CaseRunner(client, unique_names)
+        client.close()
+        return
+
+    pool = request.getfixturevalue("driver_pool")
+    with TIMINGS.phase('startup'):
+        driver = pool.checkout() if pool is not None else create_chrome_driver()
+    client = BrowserFormClient(TIMINGS.instrument(driver) if TIMINGS.enabled else driver, base_url)
+
+    # Per xdist worker, so parallel runs don't overwrite each other's files;
+    # module and mode in the name keep case ids shared by modules apart
+    directory = worker_screenshot_dir(SCREENSHOT_DIR)
+    prefix = f"{request.module.__name__}-{request.param}"
+
+    def capture(case_id):
+        screenshot_service.SERVICE.capture(client.driver, os.path.join(directory, f"{prefix}-{case_id}.png"))
+
+    yield CaseRunner(client, unique_names, capture)
+    client.close()
+    with TIMINGS.phase('startup'):
+        if pool is not None:
+            pool.checkin(driver)
+        else:
+            driver.quit()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Balance browser tests over the xdist workers when using --dist loadgroup"""
+    # On workers xdist sets dist to "no" and keeps the mode in `loadgroup`;
+    # tryfirst so the groups exist before xdist adds them to the node ids
+    if config.getoption('loadgroup', False):
+        assign_schedule_groups(items, worker_count())
+
+
+def create_chrome_driver():
+    """
+    Create a Chrome WebDriver instance.
     Uses headless mode for CI/CD compatibility.
     """
     chrome_options = Options()
@@ -44,77 +217,183 @@ def driver():
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-infobars")
     
-    # Create driver
-    service = Service(ChromeDriverManager().install())
+    # Create driver (chromedriver path is resolved once per machine)
+    service = Service(resolve_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.implicitly_wait(10)
-    
-    yield driver
-    
-    # Cleanup
-    driver.quit()
+    return driver
 
 
-# ==================== STUB/DRIVER IMPLEMENTATIONS ====================
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Session-wide pool of warm Chrome instances (None when pooling is disabled)"""
+    size = request.config.getoption("--driver-pool-size")
+    if size < 1:
+        yield None
+        return
+
+    pool = DriverPool(create_chrome_driver, size=size,
+                      max_uses=request.config.getoption("--driver-max-uses"))
+    yield pool
+    pool.close()
 
-class DatabaseStub:
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
     """
-    Stub untuk mensimulasikan database tanpa koneksi real.
-    Digunakan untuk unit testing tanpa dependency database.
+    Provide a clean Chrome WebDriver for each test function.
+    Drivers come from the session pool unless pooling is disabled or the
+    test is marked with @pytest.mark.fresh_driver.
     """
-    def __init__(self):
-        self.users = {
-            'irul': {
-                'id': 1,
-                'name': '',  # Sengaja kosong sesuai requirement
-                'username': 'irul',
-                'email': 'irul@irul.com',
-                'password': '$2y$10$D9yc9Mt0t8niCNO9di8ejOUPib46suwHghqFnJRKQJ3Z6uwRDxfw.'  # irul123
-            },
-            'ahmad': {
-                'id': 2,
-                'name': '',  # Sengaja kosong sesuai requirement
-                'username': 'ahmad',
-                'email': 'ahmad@ahmad.com',
-                'password': '$2y$10$OWez2au.UMnz3yedD0BqH.bsOC374XoV9VhMigepVzLyuq2jETHs2'  # ahmad123
-            }
-        }
-    
-    def get_user(self, username):
-        """Get user by username"""
-        return self.users.get(username)
-    
-    def user_exists(self, username):
-        """Check if username exists"""
-        return username in self.users
-    
-    def add_user(self, username, name, email, password_hash):
-        """Add new user"""
-        if self.user_exists(username):
-            return False
-        
-        new_id = max([u['id'] for u in self.users.values()]) + 1
-        self.users[username] = {
-            'id': new_id,
-            'name': name,
-            'username': username,
-            'email': email,
-            'password': password_hash
-        }
-        return True
-    
-    def clear_test_users(self):
-        """Remove test users (keep only original users)"""
-        self.users = {k: v for k, v in self.users.items() if k in ['irul', 'ahmad']}
+    if driver_pool is None or request.node.get_closest_marker("fresh_driver"):
+        with TIMINGS.phase('startup'):
+            driver = create_chrome_driver()
+        yield TIMINGS.instrument(driver) if TIMINGS.enabled else driver
+        # Cleanup
+        with TIMINGS.phase('startup'):
+            driver.quit()
+        return
+
+    with TIMINGS.phase('startup'):
+        driver = driver_pool.checkout()
+    yield TIMINGS.instrument(driver) if TIMINGS.enabled else driver
+    with TIMINGS.phase('startup'):
+        driver_pool.checkin(driver)
 
 
+@pytest.fixture(scope="session")
+def auth_session(base_url, http_adapter):
+    """Session of user irul, logged in once over HTTP for the whole run"""
+    return AuthenticatedSession(base_url, http_adapter)
+
+
+@pytest.fixture
+def logged_in_driver(driver, auth_session):
+    """Driver that already carries irul's session cookie (no login form round-trip)"""
+    return auth_session.inject(driver)
+
+
+def pytest_configure(config):
+    """Apply the screenshot capture policy and enable phase timing"""
+    screenshot_service.SERVICE.configure(
+        config.getoption("--screenshots"),
+        config.getoption("--screenshot-sample-rate"),
+        config.getoption("--screenshot-buffer"),
+    )
+    TIMINGS.enabled = bool(config.getoption("--timing-report"))
+
+
+def pytest_runtest_logreport(report):
+    """Add each phase's (setup/call/teardown) duration to the test's wall time"""
+    TIMINGS.finish(report.nodeid, report.duration)
+    workbook.RESULTS.record(report)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Write the buffered screenshots of a failing test"""
+    outcome = yield
+    if outcome.get_result().failed:
+        screenshot_service.SERVICE.test_failed()
+
+
+@pytest.fixture(autouse=True)
+def _track_waits(request):
+    """Attribute wait, screenshot and phase times to the running test"""
+    waits.STATS.begin(request.node.nodeid)
+    screenshot_service.SERVICE.begin(request.node.nodeid)
+    TIMINGS.begin(request.node.nodeid)
+    yield
+    waits.STATS.begin(None)
+    screenshot_service.SERVICE.begin(None)
+    TIMINGS.begin(None)
+
+
+def pytest_sessionfinish(session):
+    """Write out every queued screenshot and apply the retention policy"""
+    service = screenshot_service.SERVICE
+    service.close()
+    # Only the xdist controller (or a serial run) prunes, after all workers finished
+    if service.store is not None and not os.environ.get('PYTEST_XDIST_WORKER'):
+        service.store.prune(session.config.getoption("--screenshot-keep-runs"))
+
+    report_path = session.config.getoption("--timing-report")
+    if report_path and TIMINGS.tests:
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            root, ext = os.path.splitext(report_path)
+            report_path = f"{root}-{worker}{ext}"
+        TIMINGS.write_report(report_path)
+
+    # The controller receives every worker's reports and writes the column once
+    if session.config.getoption("--workbook-results") and not os.environ.get('PYTEST_XDIST_WORKER'):
+        workbook.RESULTS.write()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report wait time saved over fixed sleeps, time blocked on screenshots and phase timings"""
+    _report_waits(terminalreporter)
+    _report_screenshots(terminalreporter)
+    _report_timings(terminalreporter)
+
+
+def _report_waits(terminalreporter):
+    rows = waits.STATS.saved()
+    if not rows:
+        return
+    terminalreporter.section("wait time saved vs fixed sleeps")
+    for test_id, saved, waited, replaced in rows[:10]:
+        terminalreporter.write_line(
+            f"{saved:6.2f}s saved  (waited {waited:5.2f}s, sleeps {replaced:5.2f}s)  {test_id}")
+    total_saved = sum(row[1] for row in rows)
+    terminalreporter.write_line(f"Total: {total_saved:.2f}s saved across {len(rows)} tests")
+
+
+def _report_screenshots(terminalreporter):
+    service = screenshot_service.SERVICE
+    if not service.captures:
+        return
+    terminalreporter.section("screenshots")
+    terminalreporter.write_line(
+        f"{service.captures} captured, {service.written} written; tests blocked "
+        f"{service.total_blocked:.2f}s in total, background writes took {service.write_seconds:.2f}s")
+    if service.store is not None:
+        terminalreporter.write_line(
+            f"{service.store.stored} new images stored, {service.store.deduplicated} duplicates skipped")
+    for test_id, seconds in sorted(service.blocked.items(), key=lambda kv: kv[1], reverse=True)[:5]:
+        terminalreporter.write_line(f"{seconds:6.2f}s blocked  {test_id}")
+    for filepath, exc in service.errors:
+        terminalreporter.write_line(f"FAILED to write {filepath}: {exc}", red=True)
+
+
+def _report_timings(terminalreporter):
+    if not TIMINGS.tests:
+        return
+    terminalreporter.section("phase timings")
+    totals = TIMINGS.phase_totals()
+    overall = sum(totals[phase] for phase in PHASES) or 1.0
+    for phase, seconds in sorted(totals.items(), key=lambda kv: kv[1], reverse=True):
+        share = f"{seconds / overall:6.1%}" if phase != 'server' else "  (overlaps)"
+        terminalreporter.write_line(f"{seconds:8.2f}s {share}  {phase}")
+    terminalreporter.write_line("Slowest tests:")
+    for test_id, timing in TIMINGS.slowest(10):
+        top_phase = max(PHASES, key=lambda phase: timing.phases[phase])
+        terminalreporter.write_line(
+            f"{timing.total:8.2f}s  (most in {top_phase}: {timing.phases[top_phase]:.2f}s)  {test_id}")
+
+
+# ==================== STUB/DRIVER IMPLEMENTATIONS ====================
+
 class LoginDriver:
     """
     Test Driver untuk modul Login.
     Menyediakan interface untuk testing login functionality.
+    Passwords are checked like login.php's password_verify(); pass a
+    PasswordVerifier with `workers` to check batches on a thread pool.
     """
-    def __init__(self, db_stub=None):
-        self.db = db_stub or DatabaseStub()
+    def __init__(self, db_stub=None, verifier=None):
+        self.db = db_stub if db_stub is not None else DatabaseStub()
+        self.verifier = verifier or passwords.VERIFIER
         self.session = {}
     
     def attempt_login(self, username, password):
@@ -129,14 +408,23 @@ class LoginDriver:
         if not password or not password.strip():
             return {'success': False, 'error': 'Data tidak boleh kosong !!', 'redirect': None}
         
-        # Check user exists
-        user = self.db.get_user(username)
-        if not user:
+        # Check user exists: login.php's single password-hash lookup
+        hashed = self.db.get_password_hash(username)
+        if hashed is None:
             return {'success': False, 'error': 'Register User Gagal !!', 'redirect': None}
         
-        # In real scenario, would verify password hash
-        # For stub testing, we simulate password verification
+        # Wrong password: login.php sets no error and does not redirect
+        if not self.verifier.verify(password, hashed):
+            return {'success': False, 'error': None, 'redirect': None}
+
+        self.session['username'] = username
         return {'success': True, 'error': None, 'redirect': 'index.php'}
+
+    def attempt_logins(self, credentials):
+        """attempt_login() for each (username, password), verified concurrently"""
+        futures = [self.verifier.submit(self.attempt_login, username, password)
+                   for username, password in credentials]
+        return [future.result() for future in futures]
     
     def is_logged_in(self):
         """Check if user is logged in"""
@@ -153,7 +441,7 @@ class RegisterDriver:
     Menyediakan interface untuk testing register functionality.
     """
     def __init__(self, db_stub=None):
-        self.db = db_stub or DatabaseStub()
+        self.db = db_stub if db_stub is not None else DatabaseStub()
         self.session = {}
     
     def attempt_register(self, name, email, username, password, repassword):
@@ -183,12 +471,20 @@ class RegisterDriver:
         return self.db.user_exists(username)
 
 
+@pytest.fixture(scope="session")
+def db_base(request):
+    """Seed dataset in the --db-backend store, built once per session"""
+    db = open_store(request.config.getoption("--db-backend"))
+    yield db
+    db.close()
+
+
 @pytest.fixture
-def db_stub():
-    """Provide a fresh DatabaseStub for each test"""
-    stub = DatabaseStub()
+def db_stub(db_base):
+    """Provide a forked store for each test; its changes are dropped afterwards"""
+    stub = db_base.fork()
     yield stub
-    stub.clear_test_users()
+    stub.restore()
 
 @pytest.fixture
 def login_driver(db_stub):
@@ -199,3 +495,55 @@ def login_driver(db_stub):
 def register_driver(db_stub):
     """Provide RegisterDriver with stub database"""
     return RegisterDriver(db_stub)
+
+
+# ==================== FAKES FOR THE SUPPORT-MODULE TESTS ====================
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver session"""
+    def __init__(self):
+        self.crashed = False
+        self.quit_called = False
+        self.current_url = 'about:blank'
+        self.cookies_cleared = 0
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise WebDriverException("session deleted")
+        return ['main']
+
+    @property
+    def switch_to(self):
+        return self
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        pass
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+# users row for bulk_load() tests
+SYNTH = {'name': '', 'email': 'bulk@test.com', 'password': 'hash'}
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Stub server over a fresh DatabaseStub, shared by the tests of one module"""
+    server = StubServer(DatabaseStub()).start()
+    yield server
+    server.stop()
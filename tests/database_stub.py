@@ -0,0 +1,230 @@
+"""
+In-memory stand-in for the `users` table.
+
+Users are indexed by username (primary lookup), id and email, ids come from
+a counter like AUTO_INCREMENT, and every operation holds a re-entrant lock
+so one stub can be shared by the stub server's threads and by concurrent
+test helpers.
+
+`fork()` gives a copy-on-write view of a stub: reads fall through to the
+parent's indexes, writes land in the fork's own overlay, and `restore()`
+drops them again. Build a large dataset once and fork it per test instead
+of rebuilding it. Records are shared with the parent, so treat them as
+read-only.
+
+`collation` mirrors the column collation of `users`:
+
+    'general_ci'  utf8mb4_general_ci (the table's collation, default):
+                  case-insensitive, trailing spaces ignored
+    'binary'      exact string comparison (the historical stub behaviour)
+
+Usernames and emails are unique under that collation, like the UNIQUE
+indexes of db/migrations/001_users_unique_username_email.sql: the indexes
+are keyed on the normalised value, so 'Irul ' finds and blocks 'irul'.
+"""
+import sys
+import threading
+from collections import ChainMap
+
+COLLATIONS = ('general_ci', 'binary')
+
+SEED_USERS = (
+    {
+        'id': 1,
+        'name': '',  # Sengaja kosong sesuai requirement
+        'username': 'irul',
+        'email': 'irul@irul.com',
+        'password': '$2y$10$D9yc9Mt0t8niCNO9di8ejOUPib46suwHghqFnJRKQJ3Z6uwRDxfw.'  # irul123
+    },
+    {
+        'id': 2,
+        'name': '',  # Sengaja kosong sesuai requirement
+        'username': 'ahmad',
+        'email': 'ahmad@ahmad.com',
+        'password': '$2y$10$OWez2au.UMnz3yedD0BqH.bsOC374XoV9VhMigepVzLyuq2jETHs2'  # ahmad123
+    },
+)
+
+
+class UserRecord:
+    """
+    One row of `users`. Slots instead of a per-user dict keep large synthetic
+    datasets compact; `password` is interned because users share a few
+    hashes, which rows read from SQL or files would otherwise each copy.
+    Supports the dict-style access the tests use
+    (`user['name']`, `user.get('email')`).
+    """
+    __slots__ = ('id', 'name', 'username', 'email', 'password')
+    FIELDS = __slots__
+
+    def __init__(self, id, name, username, email, password):
+        self.id = id
+        self.name = name
+        self.username = username
+        self.email = email
+        self.password = sys.intern(password)
+
+    @classmethod
+    def from_dict(cls, user):
+        return cls(**{field: user[field] for field in cls.FIELDS})
+
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in self.FIELDS else default
+
+    def keys(self):
+        return self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __contains__(self, field):
+        return field in self.FIELDS
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, UserRecord):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"UserRecord(id={self.id!r}, username={self.username!r}, email={self.email!r})"
+
+
+class DatabaseStub:
+    """
+    Stub untuk mensimulasikan database tanpa koneksi real.
+    Digunakan untuk unit testing tanpa dependency database.
+    """
+    def __init__(self, users=SEED_USERS, collation='general_ci'):
+        if collation not in COLLATIONS:
+            raise ValueError(f"Unknown collation {collation!r}, expected one of {COLLATIONS}")
+        self.collation = collation
+        self._lock = threading.RLock()
+        self.users = {}      # key(username) -> user
+        self._by_id = {}     # id -> user
+        self._by_email = {}  # key(email) -> user (unique)
+        self._next_id = 1
+        self._parent = None
+        for user in users:
+            self._insert(UserRecord.from_dict(user))
+        self._seed_ids = frozenset(self._by_id)
+
+    def key(self, value):
+        """Index key of a username/email under the stub's collation"""
+        if self.collation == 'general_ci':
+            return value.rstrip(' ').lower()
+        return value
+
+    def _insert(self, user):
+        self.users[self.key(user.username)] = user
+        self._by_id[user.id] = user
+        self._by_email[self.key(user.email)] = user
+        self._next_id = max(self._next_id, user.id + 1)
+
+    def get_user(self, username):
+        """Get user by username"""
+        with self._lock:
+            return self.users.get(self.key(username))
+
+    def get_user_by_id(self, user_id):
+        """Get user by id"""
+        with self._lock:
+            return self._by_id.get(user_id)
+
+    def get_user_by_email(self, email):
+        """Get user by email"""
+        with self._lock:
+            return self._by_email.get(self.key(email))
+
+    def get_password_hash(self, username):
+        """Password hash of `username` (login.php's lookup), or None"""
+        with self._lock:
+            user = self.users.get(self.key(username))
+            return user.password if user is not None else None
+
+    def user_exists(self, username):
+        """Check if username exists"""
+        with self._lock:
+            return self.key(username) in self.users
+
+    def add_user(self, username, name, email, password_hash):
+        """
+        Add new user; the uniqueness checks and insert are atomic.
+        False when the username or email is taken (a duplicate-key error).
+        """
+        with self._lock:
+            if self.user_exists(username) or self.key(email) in self._by_email:
+                return False
+            self._insert(UserRecord(self._next_id, name, username, email, password_hash))
+            return True
+
+    def bulk_load(self, users):
+        """
+        Insert an iterable of UserRecords (or user dicts) under one lock,
+        keeping their ids. Users whose id, username or email is taken are
+        skipped.
+        Returns the number of users inserted.
+        """
+        inserted = 0
+        with self._lock:
+            for user in users:
+                if not isinstance(user, UserRecord):
+                    user = UserRecord.from_dict(user)
+                if (self.key(user.username) in self.users or user.id in self._by_id
+                        or self.key(user.email) in self._by_email):
+                    continue
+                self._insert(user)
+                inserted += 1
+        return inserted
+
+    def fork(self):
+        """Copy-on-write view of this stub; O(1) regardless of its size"""
+        with self._lock:
+            child = object.__new__(type(self))
+            child.collation = self.collation
+            child._lock = threading.RLock()
+            child.users = ChainMap({}, self.users)
+            child._by_id = ChainMap({}, self._by_id)
+            child._by_email = ChainMap({}, self._by_email)
+            child._next_id = self._next_id
+            child._parent = self
+            child._seed_ids = self._seed_ids
+            return child
+
+    def restore(self):
+        """Drop every change made since `fork()`"""
+        if self._parent is None:
+            raise RuntimeError("restore() needs a stub created with fork()")
+        with self._lock:
+            for index in (self.users, self._by_id, self._by_email):
+                index.maps[0].clear()
+            self._next_id = self._parent._next_id
+
+    def clear_test_users(self):
+        """Remove test users (keep only original users)"""
+        if self._parent is not None:
+            return self.restore()
+        with self._lock:
+            for user_id in [i for i in self._by_id if i not in self._seed_ids]:
+                user = self._by_id.pop(user_id)
+                del self.users[self.key(user.username)]
+                del self._by_email[self.key(user.email)]
+
+    def __len__(self):
+        with self._lock:
+            if self._parent is not None:
+                # Usernames added to a fork never shadow the parent's
+                return len(self.users.maps[0]) + len(self._parent)
+            return len(self.users)
+
+    def close(self):
+        """Nothing to release; here for the storage backend interface"""
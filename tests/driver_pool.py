@@ -0,0 +1,168 @@
+"""
+Pool of warm Chrome WebDriver instances shared across a test session.
+
+Launching Chrome dominates the run time of the Selenium suite, so instead of
+creating and quitting a browser for every test the `driver` fixture checks an
+instance out of this pool, resets its state and checks it back in afterwards.
+"""
+import queue
+import threading
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+
+class PooledDriver:
+    """WebDriver instance plus the bookkeeping the pool needs"""
+    def __init__(self, driver, overflow=False):
+        self.driver = driver
+        self.uses = 0
+        self.overflow = overflow
+
+
+class DriverPool:
+    """
+    Fixed-size pool of WebDriver instances.
+
+    `factory` is a zero-argument callable returning a new WebDriver.
+    A driver is recycled (quit and replaced) when it fails the health check
+    or after `max_uses` checkouts. When all `size` drivers are checked out
+    (e.g. a module-scoped fixture holds one), checkout() waits
+    `overflow_wait` seconds for one to come back and then starts an
+    overflow driver, which is quit on checkin instead of pooled.
+    """
+    def __init__(self, factory, size=1, max_uses=50, overflow_wait=1.0):
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.overflow_wait = overflow_wait
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._checked_out = {}
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'overflow': 0}
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _new(self, overflow=False):
+        try:
+            entry = PooledDriver(self.factory(), overflow)
+        except BaseException:
+            if not overflow:
+                with self._lock:
+                    self._created -= 1
+            raise
+        self._count('overflow' if overflow else 'created')
+        return entry
+
+    def checkout(self):
+        """
+        Return a clean driver: an idle one, a new one while the pool is below
+        size, or one checked in within `overflow_wait`; else an overflow driver
+        """
+        try:
+            entry = self._idle.get_nowait()
+            self._count('reused')
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                entry = self._new()
+            else:
+                try:
+                    entry = self._idle.get(timeout=self.overflow_wait)
+                    self._count('reused')
+                except queue.Empty:
+                    entry = self._new(overflow=True)
+
+        with self._lock:
+            entry.uses += 1
+            self._checked_out[id(entry.driver)] = entry
+        return entry.driver
+
+    def checkin(self, driver):
+        """Reset a driver and return it to the pool, or recycle it"""
+        with self._lock:
+            entry = self._checked_out.pop(id(driver), None)
+        if entry is None:
+            return
+
+        if entry.overflow:
+            self._quit(entry)
+            return
+        if entry.uses >= self.max_uses or not self.reset(driver):
+            self._discard(entry)
+            return
+        self._idle.put(entry)
+
+    @staticmethod
+    def _quit(entry):
+        try:
+            entry.driver.quit()
+        except WebDriverException:
+            pass
+
+    def _discard(self, entry):
+        self._quit(entry)
+        with self._lock:
+            self.stats['recycled'] += 1
+            self._created -= 1
+
+    @staticmethod
+    def is_healthy(driver):
+        """A driver is healthy when its session still answers commands"""
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @classmethod
+    def reset(cls, driver):
+        """
+        Clear cookies, storage, extra windows, open alerts and navigation state.
+        Returns False when the driver turned out to be unusable.
+        """
+        if not cls.is_healthy(driver):
+            return False
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            if driver.current_url.startswith('http'):
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.delete_all_cookies()
+            # Cookies of other origins the test may have visited
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.get('about:blank')
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(entry)
+        with self._lock:
+            checked_out = list(self._checked_out.values())
+            self._checked_out.clear()
+            self._created = 0
+        for entry in checked_out:
+            self._quit(entry)
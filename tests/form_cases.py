@@ -0,0 +1,153 @@
+"""
+Table-driven login/register cases.
+
+The cases live in tests/cases/form_cases.json, one entry per case:
+
+    {"id": "TC_LGN_005", "page": "login.php",
+     "fields": {"password": "test123"},
+     "expect": {"page": "login.php", "error": "Data tidak boleh kosong !!"},
+     "browser": {...}}       # optional expectation overrides for browser mode
+
+Field values may contain `{unique}` (a username unique per run and worker,
+the same within one case) and `{repeat:<text>:<n>}`. An entry with a
+`payloads` list expands into one case per payload, with `{payload}`
+substituted in its fields and `{n}` in its id.
+
+Expectations:
+
+    page           substring of the resulting URL
+    not_page       substring the resulting URL must not contain
+    error          text of the `.alert-danger` box, null for none
+    validate       texts of the `p.text-danger` messages
+    message        substring of the error box or of a validation message
+    not_reflected  the raw field values must not appear in the response
+    no_alert       no JavaScript alert may open
+
+`CaseRunner` runs every case through one form client and keeps the page
+between cases: the PHP forms re-render empty after a failed submit, so the
+next case on the same page submits straight away instead of loading it
+again. A redirect (successful login/register) resets the session.
+"""
+import functools
+import json
+import os
+import re
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cases", "form_cases.json")
+
+_REPEAT = re.compile(r"\{repeat:(.+?):(\d+)\}")
+
+
+class FormCase:
+    """One submission and its expected outcome"""
+    __slots__ = ('id', 'description', 'page', 'fields', 'expect', 'overrides')
+
+    def __init__(self, id, page, fields, expect, description='', overrides=None):
+        self.id = id
+        self.description = description
+        self.page = page
+        self.fields = fields
+        self.expect = expect
+        self.overrides = overrides or {}
+
+    def expected(self, mode):
+        """Expectations for a client mode ('browser' or 'http')"""
+        return {**self.expect, **self.overrides.get(mode, {})}
+
+    def render(self, unique):
+        """Field values with `{unique}` replaced"""
+        return {name: value.replace('{unique}', unique) for name, value in self.fields.items()}
+
+    def __repr__(self):
+        return f"FormCase({self.id!r})"
+
+
+def build_case(entry, case_id=None, payload=None):
+    """FormCase of one spec entry, with `{payload}` replaced when given"""
+    fields = {}
+    for name, value in entry.get('fields', {}).items():
+        value = _REPEAT.sub(lambda m: m.group(1) * int(m.group(2)), value)
+        fields[name] = value.replace('{payload}', payload) if payload is not None else value
+    overrides = {mode: entry[mode] for mode in ('browser', 'http') if mode in entry}
+    return FormCase(case_id or entry['id'], entry['page'], fields, entry.get('expect', {}),
+                    entry.get('description', ''), overrides)
+
+
+def _expand(entry):
+    if 'payloads' not in entry:
+        return [build_case(entry)]
+    return [build_case(entry, entry['id'].replace('{n}', f"{n:02d}"), payload)
+            for n, payload in enumerate(entry['payloads'], 1)]
+
+
+@functools.lru_cache(maxsize=8)
+def _load(path, mtime_ns, size):
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+    return tuple(case for entry in spec['cases'] for case in _expand(entry))
+
+
+def load_cases(path=SPEC_PATH):
+    """Parsed cases of a spec file; parsed again only when the file changes"""
+    stat = os.stat(path)
+    return _load(path, stat.st_mtime_ns, stat.st_size)
+
+
+class CaseRunner:
+    """Run FormCases through one FormClient, reusing the rendered form between cases"""
+    def __init__(self, client, names, capture=None):
+        self.client = client
+        self.names = names
+        self.capture = capture     # callable(case_id), e.g. a screenshot
+        self.on_form = None        # page whose freshly rendered form is displayed
+        self.page_loads = 0
+
+    def run(self, case):
+        """Submit `case` and return the list of unmet expectations"""
+        unique = self.names.username("case")
+        fields = case.render(unique)
+        if self.on_form != case.page:
+            self.client.open(case.page)
+            self.page_loads += 1
+        self.client.submit(**fields)
+
+        alert = self.client.dismiss_alert()
+        if self.capture is not None:
+            self.capture(case.id)
+        failures = self._check(case.expected(self.client.mode), fields, alert)
+
+        if alert is not None or self.client.blocked or not self.client.on_page(case.page):
+            # Typed values are still in the form, or we left it (redirect)
+            self.on_form = None
+            if not self.client.on_page(case.page):
+                self.client.reset_session()
+        else:
+            self.on_form = case.page
+        return failures
+
+    def _check(self, expect, fields, alert):
+        failures = []
+        if 'page' in expect and not self.client.on_page(expect['page']):
+            failures.append(f"expected {expect['page']}, got {self.client.current_url}")
+        if 'not_page' in expect and self.client.on_page(expect['not_page']):
+            failures.append(f"unexpectedly reached {self.client.current_url}")
+        if 'error' in expect:
+            error = self.client.error_text()
+            if error != expect['error']:
+                failures.append(f"expected error {expect['error']!r}, got {error!r}")
+        if 'validate' in expect:
+            validate = self.client.validate_texts()
+            if validate != expect['validate']:
+                failures.append(f"expected validation {expect['validate']!r}, got {validate!r}")
+        if 'message' in expect:
+            messages = [self.client.error_text() or ''] + self.client.validate_texts()
+            if not any(expect['message'] in message for message in messages):
+                failures.append(f"expected a message containing {expect['message']!r}, got {messages!r}")
+        if expect.get('no_alert') and alert is not None:
+            failures.append(f"JavaScript alert opened: {alert!r}")
+        if expect.get('not_reflected'):
+            source = self.client.page_source
+            reflected = [value for value in fields.values() if '<' in value and value in source]
+            if reflected:
+                failures.append(f"unescaped input in response: {reflected!r}")
+        return failures
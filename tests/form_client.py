@@ -0,0 +1,198 @@
+"""
+Form clients for login.php / register.php with one assertion surface.
+
+`BrowserFormClient` drives Chrome; `HttpFormClient` posts the same field
+names over a persistent HTTP connection pool with cookie handling and
+follows redirects, without rendering anything. Both expose `open()`,
+`submit()`, `current_url`, `page_source`, `error_text()` and
+`validate_texts()`, so a test written against the `form_client` fixture
+runs unchanged in either mode.
+
+Note: HTTP mode has no HTML5 validation (e.g. `type="email"`), so the
+server sees inputs a browser would have blocked.
+"""
+import html
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from waits import submit_and_wait, wait_for_page_load
+
+# Field name -> element id in the PHP forms
+FIELD_IDS = {
+    'username': 'username',
+    'password': 'InputPassword',
+    'name': 'name',
+    'email': 'InputEmail',
+    'repassword': 'InputRePassword',
+}
+
+_ALERT_DANGER = re.compile(r'<div class="alert alert-danger"[^>]*>(.*?)</div>', re.DOTALL)
+_TEXT_DANGER = re.compile(r'<p class="text-danger">(.*?)</p>', re.DOTALL)
+
+
+def _texts(pattern, page_source):
+    return [html.unescape(text).strip() for text in pattern.findall(page_source)]
+
+
+class FormClient:
+    """Assertion surface shared by both modes"""
+    mode = None
+    # True when the last submit never reached the server (HTML5 validation)
+    blocked = False
+
+    def error_text(self):
+        """Text of the `.alert-danger` box, or None when absent"""
+        texts = _texts(_ALERT_DANGER, self.page_source)
+        return texts[0] if texts else None
+
+    def validate_texts(self):
+        """Texts of the `p.text-danger` validation messages"""
+        return _texts(_TEXT_DANGER, self.page_source)
+
+    def on_page(self, page):
+        return page in self.current_url
+
+    def dismiss_alert(self):
+        """Text of an open JavaScript alert, dismissed; None when there is none"""
+        return None
+
+
+class HttpFormClient(FormClient):
+    """Submit the PHP forms over HTTP, keeping connections and cookies"""
+    mode = 'http'
+
+    def __init__(self, base_url, adapter=None, pool_size=10):
+        self.base_url = base_url.rstrip('/')
+        # Each client has its own cookie jar; connections live in the
+        # adapter, which can be shared between clients to reuse them
+        self.session = requests.Session()
+        adapter = adapter or HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._response = None
+
+    def open(self, page):
+        self._response = self.session.get(f"{self.base_url}/{page}")
+        return self
+
+    def submit(self, **fields):
+        """POST the fields (plus `submit`) to the current page's form action"""
+        data = {name: value for name, value in fields.items() if value is not None}
+        data.setdefault('submit', '')
+        action = self.current_url.split('?', 1)[0]
+        self._response = self.session.post(action, data=data)
+        return self
+
+    @property
+    def current_url(self):
+        return self._response.url
+
+    @property
+    def page_source(self):
+        return self._response.text
+
+    @property
+    def cookies(self):
+        return self.session.cookies
+
+    def reset_session(self):
+        """Forget the PHP session (log out client-side)"""
+        self.session.cookies.clear()
+
+    def close(self):
+        self.session.cookies.clear()
+
+
+class BrowserFormClient(FormClient):
+    """Same interface on top of a Selenium WebDriver"""
+    mode = 'browser'
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url.rstrip('/')
+
+    def open(self, page):
+        self.driver.get(f"{self.base_url}/{page}")
+        wait_for_page_load(self.driver)
+        return self
+
+    def submit(self, **fields):
+        """Type the non-empty fields and click the submit button"""
+        for name, value in fields.items():
+            if value:
+                self.driver.find_element(By.ID, FIELD_IDS[name]).send_keys(value)
+        self.blocked = not submit_and_wait(self.driver)
+        return self
+
+    @property
+    def current_url(self):
+        return self.driver.current_url
+
+    @property
+    def page_source(self):
+        return self.driver.page_source
+
+    @property
+    def cookies(self):
+        return {c['name']: c['value'] for c in self.driver.get_cookies()}
+
+    def dismiss_alert(self):
+        try:
+            alert = self.driver.switch_to.alert
+            text = alert.text
+            alert.dismiss()
+            return text
+        except NoAlertPresentException:
+            return None
+
+    def reset_session(self):
+        self.driver.delete_all_cookies()
+
+    def close(self):
+        pass
+
+
+class AuthenticatedSession:
+    """
+    PHPSESSID of a logged-in user, obtained once over HTTP and shared.
+    `inject(driver)` hands the session to a browser without the form
+    round-trip. Call `invalidate()` after a test logs the session out.
+    """
+    cookie_name = 'PHPSESSID'
+
+    def __init__(self, base_url, adapter=None, username='irul', password='irul123'):
+        self.base_url = base_url.rstrip('/')
+        self.adapter = adapter
+        self.username = username
+        self.password = password
+        self._value = None
+        self.logins = 0
+
+    def cookie(self):
+        """Session id, logging in over HTTP the first time"""
+        if self._value is None:
+            client = HttpFormClient(self.base_url, self.adapter)
+            client.open("login.php").submit(username=self.username, password=self.password)
+            if not client.on_page("index.php"):
+                raise RuntimeError(f"Login as {self.username!r} failed at {client.current_url}")
+            self._value = client.cookies.get(self.cookie_name)
+            self.logins += 1
+        return self._value
+
+    def invalidate(self):
+        self._value = None
+
+    def inject(self, driver):
+        """Set the session cookie in `driver` for `base_url`"""
+        cookie = {'name': self.cookie_name, 'value': self.cookie(), 'path': '/'}
+        try:
+            # Chrome can set the cookie without loading a page first
+            driver.execute_cdp_cmd('Network.setCookie', dict(cookie, url=f"{self.base_url}/"))
+        except (AttributeError, WebDriverException):
+            driver.get(f"{self.base_url}/style.css")
+            driver.add_cookie(cookie)
+        return driver
@@ -0,0 +1,243 @@
+"""
+Load generator for login.php / register.php.
+
+Fires login and register POSTs at BASE_URL from asyncio with one pooled
+HTTP client (httpx), using the same field names as the form contracts.
+Arrivals are open-loop: requests start at a target rate with exponential
+(Poisson) inter-arrival times whether or not earlier ones have finished, and
+latency is measured from the scheduled start, so a saturated server shows up
+as growing latency instead of a lower offered rate.
+
+Every request is a new client without cookies, like a login storm of fresh
+visitors. Outcomes are checked against the expected contract:
+
+    login valid      302 -> index.php
+    login invalid    200, login.php again (wrong password or unknown user)
+    register         302 -> index.php with a unique username
+    page view        200, a plain GET of login.php or register.php
+
+Besides requests per second, the result counts the TCP connections the
+client opened and, with --mysql-status, the connections MySQL accepted
+during the run (its `Connections` status counter), so runs before and after
+a koneksi.php change can be compared:
+
+    python tests/loadgen.py --base-url http://localhost/fiz_quizppl --rate 200 --duration 30
+    python tests/loadgen.py --rate 200 --page-ratio 0.5 --mysql-status
+"""
+import argparse
+import asyncio
+import http.cookiejar
+import math
+import os
+import random
+import time
+
+import httpx
+
+from parallel import UniqueNames
+
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost/fiz_quizppl')
+
+SEEDED_CREDENTIALS = [('irul', 'irul123'), ('ahmad', 'ahmad123')]
+
+
+class LoadProfile:
+    """What to send and how fast"""
+    def __init__(self, rate=50.0, duration=10.0, valid_ratio=0.5, register_ratio=0.1,
+                 max_connections=100, max_in_flight=1000, timeout=30.0, seed=None, page_ratio=0.0):
+        self.rate = rate                      # arrivals per second
+        self.duration = duration              # seconds of arrivals
+        self.valid_ratio = valid_ratio        # share of logins with valid credentials
+        self.register_ratio = register_ratio  # share of arrivals that register a new user
+        self.page_ratio = page_ratio          # share of arrivals that only GET a form page
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.seed = seed
+
+
+class LoadResult:
+    """Latencies per operation plus failures"""
+    def __init__(self):
+        self.latencies = {}  # operation -> [seconds]
+        self.failures = {}   # operation -> responses not matching the contract
+        self.errors = []     # (operation, transport error)
+        self.elapsed = 0.0
+        self.scheduled = 0
+        self.connections = 0        # TCP connections opened by the client
+        self.db_connections = None  # connections MySQL accepted, when measured
+
+    def record(self, operation, seconds, ok):
+        self.latencies.setdefault(operation, []).append(seconds)
+        if not ok:
+            self.failures[operation] = self.failures.get(operation, 0) + 1
+
+    @property
+    def completed(self):
+        return sum(len(values) for values in self.latencies.values())
+
+    @property
+    def throughput(self):
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def percentiles(self, operation=None, points=(50, 95, 99)):
+        """Nearest-rank percentiles in seconds, for one operation or all of them"""
+        if operation is None:
+            values = sorted(v for values in self.latencies.values() for v in values)
+        else:
+            values = sorted(self.latencies.get(operation, []))
+        if not values:
+            return {p: None for p in points}
+        return {p: values[min(max(math.ceil(p / 100 * len(values)) - 1, 0), len(values) - 1)]
+                for p in points}
+
+    def summary(self):
+        db = f", {self.db_connections} database connections" if self.db_connections is not None else ""
+        lines = [f"{self.completed}/{self.scheduled} requests in {self.elapsed:.2f}s "
+                 f"= {self.throughput:.1f} req/s, {len(self.errors)} transport errors",
+                 f"{self.connections} client connections{db}"]
+        for operation in sorted(self.latencies) + [None]:
+            p = self.percentiles(operation)
+            if p[50] is None:
+                continue
+            count = len(self.latencies[operation]) if operation else self.completed
+            failed = self.failures.get(operation, 0) if operation else sum(self.failures.values())
+            lines.append(f"{operation or 'all':<14} n={count:<7} unexpected={failed:<5} "
+                         f"p50={p[50] * 1000:7.1f}ms p95={p[95] * 1000:7.1f}ms p99={p[99] * 1000:7.1f}ms")
+        return "\n".join(lines)
+
+
+def _no_cookies():
+    """Cookie jar that stores nothing, so every request is a fresh visitor"""
+    return http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+def mysql_connections(**config):
+    """MySQL's `Connections` counter (connection attempts since startup), via mysql-connector-python"""
+    try:
+        import mysql.connector
+    except ImportError as exc:
+        raise RuntimeError("--mysql-status needs mysql-connector-python "
+                           "(pip install mysql-connector-python)") from exc
+    from storage import mysql_config
+    conn = mysql.connector.connect(**mysql_config(**config))
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Connections'")
+        return int(cursor.fetchone()[1])
+    finally:
+        conn.close()
+
+
+class LoadGenerator:
+    """Open-loop login/register traffic against one base URL"""
+    def __init__(self, base_url=BASE_URL, profile=None, credentials=None, names=None):
+        self.base_url = base_url.rstrip('/')
+        self.profile = profile or LoadProfile()
+        self.credentials = credentials or SEEDED_CREDENTIALS
+        self.names = names or UniqueNames()
+        self.random = random.Random(self.profile.seed)
+
+    def _next_operation(self):
+        """Pick an operation and its form fields (None for a GET)"""
+        roll = self.random.random()
+        if roll < self.profile.page_ratio:
+            return 'page_view', self.random.choice(('login.php', 'register.php')), None
+        roll -= self.profile.page_ratio
+        if roll < self.profile.register_ratio:
+            username = self.names.username("load")
+            return 'register', 'register.php', {
+                'name': 'Load Test', 'email': f"{username}@example.com", 'username': username,
+                'password': 'LoadPass123', 'repassword': 'LoadPass123'}
+        username, password = self.random.choice(self.credentials)
+        if self.random.random() < self.profile.valid_ratio:
+            return 'login_valid', 'login.php', {'username': username, 'password': password}
+        if self.random.random() < 0.5:
+            return 'login_invalid', 'login.php', {'username': username, 'password': password + 'x'}
+        return 'login_invalid', 'login.php', {'username': self.names.username("nouser"), 'password': password}
+
+    async def _send(self, client, operation, page, fields, scheduled, result, in_flight):
+        async def trace(event, info):
+            if event == 'connection.connect_tcp.complete':
+                result.connections += 1
+
+        url = f"{self.base_url}/{page}"
+        extensions = {'trace': trace}
+        try:
+            async with in_flight:
+                if fields is None:
+                    response = await client.get(url, extensions=extensions)
+                else:
+                    response = await client.post(url, data=dict(fields, submit=''), extensions=extensions)
+            redirected = response.status_code == 302 and 'index.php' in response.headers.get('location', '')
+            ok = redirected if operation in ('login_valid', 'register') else response.status_code == 200
+            result.record(operation, time.perf_counter() - scheduled, ok)
+        except httpx.HTTPError as exc:
+            result.errors.append((operation, f"{type(exc).__name__}: {exc}"))
+
+    async def run_async(self):
+        profile = self.profile
+        limits = httpx.Limits(max_connections=profile.max_connections,
+                              max_keepalive_connections=profile.max_connections)
+        result = LoadResult()
+        in_flight = asyncio.Semaphore(profile.max_in_flight)
+        async with httpx.AsyncClient(limits=limits, timeout=profile.timeout,
+                                     cookies=_no_cookies(), follow_redirects=False) as client:
+            tasks = []
+            start = time.perf_counter()
+            scheduled = start
+            while True:
+                scheduled += self.random.expovariate(profile.rate)
+                if scheduled - start > profile.duration:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                operation, page, fields = self._next_operation()
+                tasks.append(asyncio.create_task(
+                    self._send(client, operation, page, fields, scheduled, result, in_flight)))
+            result.scheduled = len(tasks)
+            await asyncio.gather(*tasks)
+            result.elapsed = time.perf_counter() - start
+        return result
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent login/register load against BASE_URL")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--rate", type=float, default=50.0, help="Arrivals per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of arrivals")
+    parser.add_argument("--valid-ratio", type=float, default=0.5)
+    parser.add_argument("--register-ratio", type=float, default=0.1)
+    parser.add_argument("--page-ratio", type=float, default=0.0,
+                        help="Share of arrivals that only GET login.php/register.php")
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--synthetic-users", type=int, default=0,
+                        help="Also draw credentials from the first N users of user_generator.py")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--mysql-status", action="store_true",
+                        help="Count the connections MySQL accepts during the run (MYSQL_HOST/MYSQL_USER/...)")
+    args = parser.parse_args()
+
+    credentials = list(SEEDED_CREDENTIALS)
+    if args.synthetic_users:
+        from user_generator import SyntheticUsers
+        users = SyntheticUsers(args.synthetic_users)
+        credentials += [(users.username_for(i), users.plaintext(i)) for i in range(args.synthetic_users)]
+
+    profile = LoadProfile(rate=args.rate, duration=args.duration, valid_ratio=args.valid_ratio,
+                          register_ratio=args.register_ratio, max_connections=args.max_connections,
+                          seed=args.seed, page_ratio=args.page_ratio)
+    before = mysql_connections() if args.mysql_status else None
+    result = LoadGenerator(args.base_url, profile, credentials).run()
+    if before is not None:
+        # Less the connection made to read the counter again
+        result.db_connections = mysql_connections() - before - 1
+    print(result.summary())
+
+
+if __name__ == '__main__':
+    main()
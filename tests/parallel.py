@@ -0,0 +1,77 @@
+"""
+Helpers for running the suite in parallel with pytest-xdist.
+
+Every worker process gets its own Chrome instance (the driver pool is
+per process), its own namespace for generated usernames/emails and its own
+screenshot subdirectory, so workers never collide on test data or files.
+"""
+import itertools
+import os
+import time
+
+import pytest
+
+SCHEDULE_GROUP_PREFIX = "slot"
+
+
+def worker_id():
+    """xdist worker id (gw0, gw1, ...) or 'main' when running serially"""
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+def worker_count():
+    """Number of xdist workers (1 when running serially)"""
+    return int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+
+
+def _base36(number):
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    out = ''
+    while number:
+        number, rem = divmod(number, 36)
+        out = digits[rem] + out
+    return out or '0'
+
+
+class UniqueNames:
+    """
+    Generator of usernames/emails unique per run, per worker and per call.
+    Names are `<prefix><run token><worker><counter>`, short enough for the
+    50-character `username` column.
+    """
+    def __init__(self, worker=None):
+        worker = worker or worker_id()
+        worker_tag = worker[2:] if worker.startswith('gw') else ''
+        run_token = _base36(time.time_ns() // 1_000_000)
+        self.namespace = f"{run_token}w{worker_tag}" if worker_tag else run_token
+        self._counter = itertools.count(1)
+
+    def username(self, prefix=''):
+        return f"{prefix}{self.namespace}n{next(self._counter)}"
+
+    def email(self, prefix='', domain='test.com'):
+        return f"{self.username(prefix)}@{domain}"
+
+
+def worker_screenshot_dir(base_dir):
+    """Screenshot directory for this worker (the base directory when serial)"""
+    worker = worker_id()
+    path = base_dir if worker == 'main' else os.path.join(base_dir, worker)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def assign_schedule_groups(items, workers):
+    """
+    Spread browser tests evenly over `workers` scheduling groups.
+
+    Tests are dealt round-robin in collection order, so every worker gets
+    a similar mix of login and register tests instead of whole classes.
+    Used together with `--dist loadgroup`. Tests that don't use a browser
+    are left ungrouped, because they are cheap and scheduled freely.
+    """
+    slot = itertools.cycle(range(workers))
+    for item in items:
+        if 'driver' not in getattr(item, 'fixturenames', ()):
+            continue
+        item.add_marker(pytest.mark.xdist_group(name=f"{SCHEDULE_GROUP_PREFIX}{next(slot)}"))
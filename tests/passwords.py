@@ -0,0 +1,92 @@
+"""
+PHP-compatible password hashing for the stubs.
+
+Mirrors `password_hash($password, PASSWORD_DEFAULT)` and `password_verify()`:
+bcrypt with the `$2y$` prefix PHP emits, and PHP's truncation of the
+password to 72 bytes.
+
+`PasswordVerifier` adds a bounded LRU cache of verification results, since
+bcrypt is slow by design and stub tests check the same few passwords over
+and over, and can verify on a thread pool (bcrypt releases the GIL).
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import bcrypt
+
+BCRYPT_MAX_BYTES = 72
+DEFAULT_COST = 10
+
+
+def _password_bytes(password):
+    return password.encode('utf-8')[:BCRYPT_MAX_BYTES]
+
+
+def password_hash(password, cost=DEFAULT_COST):
+    """Hash like PHP's password_hash() with PASSWORD_DEFAULT ($2y$ prefix)"""
+    hashed = bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=cost))
+    return '$2y$' + hashed.decode('ascii')[4:]
+
+
+def password_verify(password, password_hash):
+    """Verify like PHP's password_verify(); malformed hashes never match"""
+    if not password_hash or not password_hash.startswith(('$2y$', '$2b$', '$2a$')):
+        return False
+    try:
+        return bcrypt.checkpw(_password_bytes(password), password_hash.encode('ascii'))
+    except ValueError:
+        return False
+
+
+class PasswordVerifier:
+    """password_verify() with an LRU cache of (hash, password) -> result"""
+    def __init__(self, cache_size=1024, workers=0):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt") if workers else None
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, password, password_hash):
+        """Cached result of verify(), or None without computing it"""
+        key = (password_hash, password)
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return result
+
+    def verify(self, password, password_hash):
+        result = self.cached(password, password_hash)
+        if result is not None:
+            return result
+        with self._lock:
+            self.misses += 1
+        result = password_verify(password, password_hash)
+        with self._lock:
+            self._cache[(password_hash, password)] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def submit(self, fn, *args):
+        """Run `fn(*args)` on the verification pool; inline without one"""
+        if self._pool is not None:
+            return self._pool.submit(fn, *args)
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+VERIFIER = PasswordVerifier()
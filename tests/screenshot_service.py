@@ -0,0 +1,251 @@
+"""
+Background screenshot pipeline.
+
+`driver.save_screenshot()` blocks the test while the PNG is decoded and
+written to disk. The service only grabs the base64 payload on the test's
+thread; decoding and writing happen on a small pool of writer threads fed
+through a bounded queue. The queue is flushed at session end, and the time
+tests spent blocked on captures is recorded per test.
+
+With a `ContentStore` attached, images are stored content-addressed: each
+unique image is written once under `objects/`, and a per-run manifest maps
+the screenshot name (test id/step) to its hash. Only the last K runs are
+kept.
+
+Capture policies:
+    all         every screenshot is written
+    sampled     every screenshot of a stable, hash-selected fraction of tests
+    on-failure  the last N captures of a test are kept in memory and only
+                written when the test fails
+    off         nothing is captured
+"""
+import base64
+import glob
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime
+
+from timing import TIMINGS
+
+POLICIES = ('off', 'on-failure', 'sampled', 'all')
+
+
+class ContentStore:
+    """
+    Content-addressed image storage under `root`:
+
+        objects/<hash[:2]>/<hash>.png   one file per unique image
+        runs/<run_id>-<worker>.json     screenshot name -> hash, per run
+
+    Parallel workers of one run share the run id and write one manifest each.
+    """
+    def __init__(self, root, run_id=None, worker='main'):
+        self.root = root
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.worker = worker
+        self.objects_dir = os.path.join(root, "objects")
+        self.runs_dir = os.path.join(root, "runs")
+        self.manifest = {}
+        self.stored = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.png")
+
+    def key_for(self, filepath):
+        """Screenshot name relative to the store root, without extension"""
+        return os.path.splitext(os.path.relpath(filepath, self.root))[0].replace(os.sep, '/')
+
+    def put(self, filepath, data):
+        """Store `data` once and record it under the name derived from `filepath`"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            with self._lock:
+                self.deduplicated += 1
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self.stored += 1
+        with self._lock:
+            self.manifest[self.key_for(filepath)] = digest
+        return digest
+
+    def save_manifest(self):
+        if not self.manifest:
+            return None
+        os.makedirs(self.runs_dir, exist_ok=True)
+        path = os.path.join(self.runs_dir, f"{self.run_id}-{self.worker}.json")
+        with open(path, 'w') as f:
+            json.dump({'run': self.run_id, 'worker': self.worker, 'screenshots': self.manifest},
+                      f, indent=1, sort_keys=True)
+        return path
+
+    def _load_manifests(self):
+        manifests = []
+        for path in glob.glob(os.path.join(self.runs_dir, "*.json")):
+            with open(path) as f:
+                manifests.append((path, json.load(f)))
+        return manifests
+
+    def prune(self, keep_runs):
+        """Keep the manifests of the newest `keep_runs` runs and delete unreferenced objects"""
+        runs = {}
+        for path, manifest in self._load_manifests():
+            runs.setdefault(manifest['run'], []).append(path)
+        by_age = sorted(runs.values(), key=lambda paths: max(os.path.getmtime(p) for p in paths))
+        for paths in by_age[:max(len(by_age) - keep_runs, 0)]:
+            for path in paths:
+                os.remove(path)
+
+        referenced = set()
+        for _, manifest in self._load_manifests():
+            referenced.update(manifest['screenshots'].values())
+
+        removed = 0
+        for path in glob.glob(os.path.join(self.objects_dir, "*", "*.png")):
+            if os.path.splitext(os.path.basename(path))[0] not in referenced:
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+class ScreenshotService:
+    """Capture on the test thread, decode and write in the background"""
+    def __init__(self, workers=2, max_queue=64, store=None,
+                 policy='all', sample_rate=0.1, buffer_size=5):
+        self.workers = workers
+        self.store = store
+        self.configure(policy, sample_rate, buffer_size)
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._threads = []
+        self._lock = threading.Lock()
+        self.current = None
+        self.blocked = {}
+        self.captures = 0
+        self.written = 0
+        self.write_seconds = 0.0
+        self.errors = []
+        self.recording = True
+
+    def configure(self, policy='all', sample_rate=0.1, buffer_size=5):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown screenshot policy {policy!r}, expected one of {POLICIES}")
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.buffer = deque(maxlen=buffer_size)
+
+    def is_sampled(self, test_id):
+        """Stable per-test sampling decision, identical across runs and workers"""
+        if test_id is None:
+            return True
+        return zlib.crc32(test_id.encode()) % 10_000 < self.sample_rate * 10_000
+
+    def begin(self, test_id):
+        """Start a new test; captures buffered for the previous one are dropped"""
+        self.current = test_id
+        self.buffer.clear()
+        self.recording = self.policy == 'all' or (self.policy == 'sampled' and self.is_sampled(test_id))
+
+    def test_failed(self):
+        """Write the captures buffered for the current test (on-failure policy)"""
+        while self.buffer:
+            self._enqueue(*self.buffer.popleft())
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._writer, name=f"screenshot-writer-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def capture(self, driver, filepath):
+        """Grab the raw payload and queue or buffer it per the policy; returns `filepath`"""
+        if self.policy == 'off' or (self.policy == 'sampled' and not self.recording):
+            return filepath
+        start = time.perf_counter()
+        with TIMINGS.phase('screenshot'):
+            payload = driver.get_screenshot_as_base64()
+            if self.policy == 'on-failure':
+                self.buffer.append((filepath, payload))
+            else:
+                self._enqueue(filepath, payload)
+        self._record_blocked(time.perf_counter() - start)
+        return filepath
+
+    def _enqueue(self, filepath, payload):
+        self._ensure_started()
+        self._queue.put((filepath, payload))
+
+    def _record_blocked(self, seconds):
+        self.captures += 1
+        if self.current is not None:
+            self.blocked[self.current] = self.blocked.get(self.current, 0.0) + seconds
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                filepath, payload = item
+                start = time.perf_counter()
+                data = base64.b64decode(payload)
+                if self.store is not None:
+                    self.store.put(filepath, data)
+                else:
+                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                    with open(filepath, 'wb') as f:
+                        f.write(data)
+                with self._lock:
+                    self.written += 1
+                    self.write_seconds += time.perf_counter() - start
+            except Exception as exc:
+                with self._lock:
+                    self.errors.append((item[0], exc))
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued screenshot has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Flush, stop the writer threads and save the run manifest"""
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self.store is not None:
+            self.store.save_manifest()
+
+    @property
+    def total_blocked(self):
+        return sum(self.blocked.values())
+
+
+SCREENSHOT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "screenshots")
+
+SERVICE = ScreenshotService(store=ContentStore(
+    SCREENSHOT_ROOT,
+    run_id=os.environ.get('PYTEST_XDIST_TESTRUNUID'),
+    worker=os.environ.get('PYTEST_XDIST_WORKER', 'main'),
+))
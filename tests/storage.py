@@ -0,0 +1,477 @@
+"""
+Storage backends for the `users` table.
+
+Every backend offers the DatabaseStub interface that LoginDriver,
+RegisterDriver, the async drivers and the stub server code against:
+
+    get_user(username)             first user with that username, or None
+    get_user_by_id(user_id)
+    get_user_by_email(email)
+    get_password_hash(username)    the password column only (PASSWORD_HASH_QUERY)
+    user_exists(username)
+    add_user(username, name, email, password_hash)
+                                   atomic check-and-insert; False when the
+                                   username or email exists or the row is
+                                   rejected
+    bulk_load(users)               skips taken usernames/emails/ids, returns count
+    fork() / restore()             undo the writes made after fork()
+    clear_test_users()             remove the test users (seed users stay)
+    len(store), close()
+
+Backends (`open_store(backend)`):
+
+    memory   DatabaseStub, plain dicts
+    sqlite   SQLiteStore: the table from db/quiz_pengupil.sql in SQLite
+             (a file, or ':memory:'), so lookups go through a real query
+             planner and the schema's constraints
+    mysql    MySQLStore: a real MySQL/MariaDB through mysql-connector-python
+             (optional dependency), configured like koneksi.php from
+             MYSQL_HOST/MYSQL_PORT/MYSQL_USER/MYSQL_PASSWORD/MYSQL_DATABASE
+
+The SQL backends run parameterized statements only (prepared once per
+connection and reused) on a small connection pool. A VARCHAR overflow is
+rejected like MySQL's strict mode; add_user() then returns False, which
+register.php reports as "Register User Gagal !!". So is a duplicate of the
+UNIQUE username/email keys, compared under the store's collation
+(general_ci by default, like the table).
+
+The SQL tables may be shared (a SQLite file, a MySQL database the PHP app
+and other xdist workers write to), so restore() and clear_test_users()
+delete only the rows this store or fork inserted itself, by id; rows
+added by anyone else are never touched.
+"""
+import abc
+import contextlib
+import os
+import queue
+import re
+import sqlite3
+import threading
+
+from database_stub import COLLATIONS, SEED_USERS, DatabaseStub, UserRecord
+
+BACKENDS = ('memory', 'sqlite', 'mysql')
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "quiz_pengupil.sql")
+
+COLUMNS = UserRecord.FIELDS
+
+_CREATE_TABLE = re.compile(r"CREATE TABLE IF NOT EXISTS `users` \((.*?)\n\)[^;]*;", re.DOTALL)
+# login.php's lookup: one column, one row, through the username index
+PASSWORD_HASH_QUERY = "SELECT password FROM users WHERE username = ? LIMIT 1"
+
+_COLUMN = re.compile(r"`(\w+)` (\w+)(?:\((\d+)\))?(.*)")
+_UNIQUE_KEY = re.compile(r"UNIQUE KEY `(\w+)` \(`(\w+)`\)")
+
+
+def read_schema(path=SCHEMA_PATH):
+    """The `CREATE TABLE users` statement of the SQL dump"""
+    with open(path, encoding='utf-8') as f:
+        match = _CREATE_TABLE.search(f.read())
+    if match is None:
+        raise ValueError(f"No CREATE TABLE `users` in {path}")
+    return match.group(0)
+
+
+def sqlite_indexes(create_table):
+    """`CREATE UNIQUE INDEX` statements for the UNIQUE KEYs of the MySQL `users` DDL"""
+    body = _CREATE_TABLE.match(create_table).group(1)
+    return [f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON users ({column})"
+            for name, column in _UNIQUE_KEY.findall(body)]
+
+
+def sqlite_schema(create_table, collation='general_ci', indexes=True):
+    """
+    Translate the MySQL `users` DDL to an SQLite script, keeping NOT NULL,
+    VARCHAR lengths and (with `indexes`) the UNIQUE KEYs. The indexes
+    compare with the column collation, as in MySQL.
+    """
+    body = _CREATE_TABLE.match(create_table).group(1)
+    columns = []
+    for line in body.strip().splitlines():
+        column = _COLUMN.match(line.strip().rstrip(','))
+        if column is None:
+            continue  # PRIMARY KEY (`id`) is folded into the id column, UNIQUE KEYs follow
+        name, kind, length, rest = column.groups()
+        if 'AUTO_INCREMENT' in rest:
+            columns.append(f"{name} INTEGER PRIMARY KEY AUTOINCREMENT")
+            continue
+        definition = f"{name} TEXT{' NOT NULL' if 'NOT NULL' in rest else ''}"
+        if collation == 'general_ci':
+            definition += " COLLATE general_ci"
+        if kind.lower() == 'varchar' and length:
+            definition += f" CHECK (length({name}) <= {length})"
+        columns.append(definition)
+    statements = ["CREATE TABLE IF NOT EXISTS users (\n  " + ",\n  ".join(columns) + "\n)"]
+    if indexes:
+        statements += sqlite_indexes(create_table)
+    return ";\n".join(statements) + ";"
+
+
+def mysql_config(host=None, port=None, user=None, password=None, database=None):
+    """mysql.connector arguments from the given values or MYSQL_* (koneksi.php's defaults)"""
+    return {
+        'host': host or os.environ.get('MYSQL_HOST', '127.0.0.1'),
+        'port': int(port or os.environ.get('MYSQL_PORT', 3306)),
+        'user': user or os.environ.get('MYSQL_USER', 'root'),
+        'password': password if password is not None else os.environ.get('MYSQL_PASSWORD', ''),
+        'database': database or os.environ.get('MYSQL_DATABASE', 'quiz_pengupil'),
+    }
+
+
+class ConnectionPool:
+    """Up to `size` connections from `connect()`, created on demand"""
+    def __init__(self, connect, size=4):
+        self.connect = connect
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                new = self._created < self.size
+                self._created += new
+            conn = self.connect() if new else self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class SQLStore(abc.ABC):
+    """The DatabaseStub interface over parameterized SQL; subclasses provide connections"""
+    param = '?'
+    errors = ()  # exceptions meaning "row rejected"
+
+    def __init__(self, collation, pool):
+        if collation not in COLLATIONS:
+            raise ValueError(f"Unknown collation {collation!r}, expected one of {COLLATIONS}")
+        self.collation = collation
+        self.pool = pool
+        self._parent = None
+        self._inserted = set()  # ids of the rows inserted through this store
+        self._inserted_lock = threading.Lock()
+        self._seed_ids = frozenset(user['id'] for user in SEED_USERS)
+
+    def key(self, value):
+        """Comparison key of a username/email under the store's collation"""
+        if self.collation == 'general_ci':
+            return value.rstrip(' ').lower()
+        return value
+
+    def _sql(self, statement):
+        return statement.replace('?', self.param)
+
+    def _cursor(self, conn):
+        return conn.cursor()
+
+    def _query(self, statement, args=()):
+        with self.pool.connection() as conn:
+            cursor = self._cursor(conn)
+            try:
+                cursor.execute(self._sql(statement), args)
+                return cursor.fetchall() if cursor.description is not None else []
+            finally:
+                cursor.close()
+
+    def _one(self, where, args):
+        rows = self._query(f"SELECT {', '.join(COLUMNS)} FROM users WHERE {where} ORDER BY id LIMIT 1", args)
+        return UserRecord(*rows[0]) if rows else None
+
+    def get_user(self, username):
+        """Get user by username"""
+        return self._one("username = ?", (username,))
+
+    def get_user_by_id(self, user_id):
+        """Get user by id"""
+        return self._one("id = ?", (user_id,))
+
+    def get_user_by_email(self, email):
+        """Get user by email"""
+        return self._one("email = ?", (email,))
+
+    def get_password_hash(self, username):
+        """Password hash of `username` (login.php's lookup), or None"""
+        rows = self._query(PASSWORD_HASH_QUERY, (username,))
+        return rows[0][0] if rows else None
+
+    def user_exists(self, username):
+        """Check if username exists"""
+        return bool(self._query("SELECT 1 FROM users WHERE username = ? LIMIT 1", (username,)))
+
+    @abc.abstractmethod
+    def add_user(self, username, name, email, password_hash):
+        """Add new user; the existence check and insert are atomic"""
+
+    @abc.abstractmethod
+    def _insert_many(self, rows):
+        """Insert full rows (COLUMNS order) in one transaction; returns the count"""
+
+    def _track(self, ids):
+        with self._inserted_lock:
+            self._inserted.update(ids)
+
+    def _delete_inserted(self, keep=frozenset()):
+        """Delete the rows inserted through this store, except the ids in `keep`"""
+        with self._inserted_lock:
+            ids = sorted(self._inserted - keep)
+            self._inserted -= set(ids)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            self._query(f"DELETE FROM users WHERE id IN ({', '.join('?' * len(chunk))})", tuple(chunk))
+
+    def bulk_load(self, users):
+        """
+        Insert an iterable of UserRecords (or user dicts), keeping their
+        ids. Users whose id, username or email is taken are skipped.
+        Returns the number of users inserted.
+        """
+        taken, emails, ids = set(), set(), set()
+        for user_id, username, email in self._query("SELECT id, username, email FROM users"):
+            ids.add(user_id)
+            taken.add(self.key(username))
+            emails.add(self.key(email))
+        batch, inserted = [], 0
+        for user in users:
+            key, email = self.key(user['username']), self.key(user['email'])
+            if key in taken or email in emails or user['id'] in ids:
+                continue
+            taken.add(key)
+            emails.add(email)
+            ids.add(user['id'])
+            batch.append(tuple(user[column] for column in COLUMNS))
+            if len(batch) == 10_000:
+                inserted += self._load_batch(batch)
+                batch = []
+        if batch:
+            inserted += self._load_batch(batch)
+        return inserted
+
+    def _load_batch(self, rows):
+        count = self._insert_many(rows)
+        self._track(row[0] for row in rows)
+        return count
+
+    def fork(self):
+        """View of this store whose restore() deletes the rows inserted through it"""
+        child = object.__new__(type(self))
+        child.__dict__.update(self.__dict__)
+        child._parent = self
+        child._inserted = set()
+        child._inserted_lock = threading.Lock()
+        return child
+
+    def restore(self):
+        """Drop the rows inserted through this fork since `fork()`"""
+        if self._parent is None:
+            raise RuntimeError("restore() needs a store created with fork()")
+        self._delete_inserted()
+
+    def clear_test_users(self):
+        """Remove the users inserted through this store, keeping the seed users"""
+        if self._parent is not None:
+            return self.restore()
+        self._delete_inserted(keep=self._seed_ids)
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM users")[0][0]
+
+    def close(self):
+        if self._parent is None:
+            self.pool.close()
+
+
+def _general_ci(a, b):
+    a, b = a.rstrip(' ').lower(), b.rstrip(' ').lower()
+    return (a > b) - (a < b)
+
+
+class SQLiteStore(SQLStore):
+    """
+    `users` in SQLite. ':memory:' databases live as long as the store and
+    are served by one connection; files use WAL and a pool of `pool_size`.
+    `indexes=False` leaves out the UNIQUE KEYs (the table before
+    db/migrations/001); create_indexes() adds them later.
+    """
+    errors = (sqlite3.IntegrityError,)
+
+    def __init__(self, path=':memory:', users=SEED_USERS, collation='general_ci', pool_size=4,
+                 schema=SCHEMA_PATH, indexes=True):
+        self.path = path
+        self.schema = read_schema(schema)
+        if path == ':memory:':
+            pool_size = 1
+        super().__init__(collation, ConnectionPool(self._connect, pool_size))
+        with self.pool.connection() as conn:
+            conn.executescript(sqlite_schema(self.schema, collation, indexes))
+        self.bulk_load(users)
+
+    def create_indexes(self):
+        """Add the schema's UNIQUE KEYs to an existing table"""
+        with self.pool.connection() as conn:
+            for statement in sqlite_indexes(self.schema):
+                conn.execute(statement)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                               check_same_thread=False, cached_statements=128)
+        conn.create_collation('general_ci', _general_ci)
+        if self.path != ':memory:':
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def add_user(self, username, name, email, password_hash):
+        """Add new user; the existence check and insert are atomic"""
+        with self.pool.connection() as conn:
+            # Take the write lock before reading, so no other writer slips in
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(
+                    "INSERT INTO users (name, username, email, password) SELECT ?, ?, ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM users WHERE username = ?)",
+                    (name, username, email, password_hash, username))
+                conn.execute("COMMIT")
+            except self.errors:
+                return False
+            finally:
+                # Never hand a connection with an open transaction back to the pool
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+        if cursor.rowcount != 1:
+            return False
+        self._track((cursor.lastrowid,))
+        return True
+
+    def _insert_many(self, rows):
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(f"INSERT INTO users ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?)", rows)
+                conn.execute("COMMIT")
+            finally:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+        return len(rows)
+
+
+class MySQLStore(SQLStore):
+    """
+    `users` in MySQL/MariaDB via mysql-connector-python's pool and
+    server-side prepared statements. The table is created from the SQL dump
+    when missing and seeded when empty; a table imported from an older dump
+    needs db/migrations/001_users_unique_username_email.sql for its keys.
+
+    add_user() serializes writers of this store with GET_LOCK; rows inserted
+    by the PHP app at the same time are not covered.
+    """
+    param = '%s'
+
+    def __init__(self, host=None, port=None, user=None, password=None, database=None,
+                 users=SEED_USERS, collation='general_ci', pool_size=4, schema=SCHEMA_PATH):
+        try:
+            from mysql.connector import errors, pooling
+        except ImportError as exc:
+            raise RuntimeError("The mysql backend needs mysql-connector-python "
+                               "(pip install mysql-connector-python)") from exc
+        # Rejected rows only; connection and server errors propagate
+        self.errors = (errors.IntegrityError, errors.DataError)
+        config = dict(mysql_config(host, port, user, password, database),
+                      autocommit=True, sql_mode='STRICT_TRANS_TABLES')
+        self.lock_name = f"{config['database']}.users.add_user"
+        mysql_pool = pooling.MySQLConnectionPool(pool_name=f"users{id(self)}", pool_size=pool_size, **config)
+        super().__init__(collation, _MySQLPool(mysql_pool))
+        self._query(read_schema(schema))
+        if not len(self):
+            self.bulk_load(users)
+
+    def _cursor(self, conn):
+        return conn.cursor(prepared=True)
+
+    def _query(self, statement, args=()):
+        rows = super()._query(statement, args) if args else self._plain(statement)
+        return [tuple(v.decode() if isinstance(v, (bytes, bytearray)) else v for v in row) for row in rows]
+
+    def _plain(self, statement):
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(statement)
+                return cursor.fetchall() if cursor.description is not None else []
+            finally:
+                cursor.close()
+
+    def add_user(self, username, name, email, password_hash):
+        """Add new user; the existence check and insert are atomic"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor(prepared=True)
+            try:
+                cursor.execute("SELECT GET_LOCK(%s, 10)", (self.lock_name,))
+                (acquired,), = cursor.fetchall()
+                if acquired != 1:
+                    # 0 after the timeout, NULL on error: inserting now could race
+                    raise RuntimeError(f"Could not acquire MySQL lock {self.lock_name!r}")
+                try:
+                    cursor.execute("SELECT 1 FROM users WHERE username = %s LIMIT 1", (username,))
+                    if cursor.fetchall():
+                        return False
+                    cursor.execute("INSERT INTO users (name, username, email, password) VALUES (%s, %s, %s, %s)",
+                                   (name, username, email, password_hash))
+                    self._track((cursor.lastrowid,))
+                    return True
+                except self.errors:
+                    return False
+                finally:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (self.lock_name,))
+                    cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _insert_many(self, rows):
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(f"INSERT INTO users ({', '.join(COLUMNS)}) VALUES (%s, %s, %s, %s, %s)", rows)
+            finally:
+                cursor.close()
+        return len(rows)
+
+
+class _MySQLPool:
+    """ConnectionPool interface over mysql.connector.pooling"""
+    def __init__(self, pool):
+        self._pool = pool
+
+    @contextlib.contextmanager
+    def connection(self):
+        conn = self._pool.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()  # back to the pool
+
+    def close(self):
+        pass
+
+
+def open_store(backend='memory', collation='general_ci', **options):
+    """A users store of the given backend (see BACKENDS)"""
+    if backend == 'memory':
+        return DatabaseStub(collation=collation, **options)
+    if backend == 'sqlite':
+        return SQLiteStore(collation=collation, **options)
+    if backend == 'mysql':
+        return MySQLStore(collation=collation, **options)
+    raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
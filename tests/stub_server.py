@@ -0,0 +1,265 @@
+"""
+In-process WSGI stand-in for login.php and register.php.
+
+Reproduces the PHP pages on top of `DatabaseStub`, so the Selenium suite can
+run without Apache/PHP/MySQL: same markup (rendered from the PHP files
+themselves), same field ids, same error strings, same redirects and a
+PHPSESSID session cookie. index.php and logout.php are not part of the
+repository, so minimal versions are provided for the redirect targets.
+
+Start it once per session with `StubServer(db).start()` and point
+BASE_URL at `server.url`.
+"""
+import html
+import os
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from common import real_escape_string
+from passwords import password_hash, password_verify
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ERROR_EMPTY = 'Data tidak boleh kosong !!'
+ERROR_FAILED = 'Register User Gagal !!'
+ERROR_DUPLICATE = 'Username sudah terdaftar !!'
+VALIDATE_MISMATCH = 'Password tidak sama !!'
+
+INDEX_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><link rel="stylesheet" href="style.css"></head>
+<body>
+<h4>Selamat datang, {username}</h4>
+<a href="logout.php">Logout</a>
+</body>
+</html>"""
+
+
+# ==================== PHP COMPATIBILITY ====================
+
+def stripslashes(value):
+    """PHP stripslashes(): drop backslashes, keeping escaped backslashes once"""
+    return re.sub(r'\\(.?)', r'\1', value, flags=re.DOTALL)
+
+
+def php_filled(value):
+    """PHP `!empty(trim($value))` ("0" counts as empty in PHP)"""
+    trimmed = value.strip(' \t\n\r\0\x0b')
+    return trimmed not in ('', '0')
+
+
+def _form_value(raw):
+    """Field as PHP sees it after stripslashes + mysqli_real_escape_string"""
+    return real_escape_string(stripslashes(raw))
+
+
+# ==================== TEMPLATES ====================
+
+_LOGIC_BLOCK = re.compile(r"<\?php\s+require\('koneksi\.php'\);.*?\n\?>\n?", re.DOTALL)
+_CONDITIONAL = re.compile(r"<\?php if\(\$(\w+) != ''\)\s*\{\s*\?>(.*?)<\?php\s*\}\s*\?>", re.DOTALL)
+_ECHO = re.compile(r"<\?= \$(\w+); \?>")
+
+
+def load_template(filename):
+    """
+    Turn a PHP page into a render function taking `error` and `validate`.
+    The PHP logic block is dropped; `if($x != '')` blocks and `<?= $x; ?>`
+    echoes are evaluated against the given values.
+    """
+    with open(os.path.join(APP_ROOT, filename), encoding='utf-8') as f:
+        source = _LOGIC_BLOCK.sub('', f.read(), count=1)
+
+    def render(**values):
+        def conditional(match):
+            if not values.get(match.group(1)):
+                return ''
+            return _ECHO.sub(lambda m: html.escape(values.get(m.group(1), '')), match.group(2))
+        return _CONDITIONAL.sub(conditional, source)
+    return render
+
+
+# ==================== APPLICATION ====================
+
+class StubApp:
+    """WSGI application reproducing login.php / register.php against a DatabaseStub"""
+    def __init__(self, db):
+        self.db = db
+        self.sessions = {}
+        self._sessions_lock = threading.Lock()
+        self.pages = {
+            'login.php': load_template('login.php'),
+            'register.php': load_template('register.php'),
+        }
+        with open(os.path.join(APP_ROOT, 'style.css'), 'rb') as f:
+            self.stylesheet = f.read()
+
+    # -------- sessions --------
+
+    def _session(self, environ):
+        """
+        The stored session for the request's cookie, or an unsaved empty one.
+        Sessions are only kept once something is stored in them, so cookieless
+        load (loadgen, timing analysis) does not grow `sessions`.
+        """
+        cookie = SimpleCookie(environ.get('HTTP_COOKIE', ''))
+        session_id = cookie['PHPSESSID'].value if 'PHPSESSID' in cookie else None
+        with self._sessions_lock:
+            if session_id in self.sessions:
+                return session_id, self.sessions[session_id]
+        return None, {}
+
+    def _save_session(self, session_id, session):
+        """Store, keep or drop `session`; return the id of a newly started one"""
+        with self._sessions_lock:
+            if not session:
+                self.sessions.pop(session_id, None)
+            elif session_id is None:
+                session_id = secrets.token_hex(13)
+                self.sessions[session_id] = session
+                return session_id
+        return None
+
+    # -------- WSGI entry point --------
+
+    def __call__(self, environ, start_response):
+        page = environ.get('PATH_INFO', '/').rsplit('/', 1)[-1] or 'index.php'
+        if page == 'style.css':
+            start_response('200 OK', [('Content-Type', 'text/css')])
+            return [self.stylesheet]
+
+        handler = {
+            'login.php': self.login,
+            'register.php': self.register,
+            'index.php': self.index,
+            'logout.php': self.logout,
+        }.get(page)
+        if handler is None:
+            start_response('404 Not Found', [('Content-Type', 'text/plain')])
+            return [b'Not Found']
+
+        session_id, session = self._session(environ)
+        form = {}
+        if environ.get('REQUEST_METHOD') == 'POST':
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            body = environ['wsgi.input'].read(length).decode('utf-8')
+            form = {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+
+        status, location, body = handler(session, form)
+        headers = [('Content-Type', 'text/html; charset=UTF-8')]
+        new_session_id = self._save_session(session_id, session)
+        if new_session_id:
+            headers.append(('Set-Cookie', f'PHPSESSID={new_session_id}; path=/'))
+        if location:
+            headers.append(('Location', location))
+        start_response(status, headers)
+        return [body.encode('utf-8')]
+
+    # -------- pages --------
+
+    def login(self, session, form):
+        if 'username' in session:
+            return '302 Found', 'index.php', ''
+
+        error = ''
+        if 'submit' in form:
+            # The username is bound to a prepared statement, so it is not escaped
+            username = stripslashes(form.get('username', ''))
+            password = _form_value(form.get('password', ''))
+
+            if php_filled(username) and php_filled(password):
+                hashed = self.db.get_password_hash(username)
+                if hashed is not None:
+                    if password_verify(password, hashed):
+                        session['username'] = username
+                        return '302 Found', 'index.php', ''
+                else:
+                    error = ERROR_FAILED
+            else:
+                error = ERROR_EMPTY
+
+        return '200 OK', None, self.pages['login.php'](error=error)
+
+    def register(self, session, form):
+        if 'user' in session:
+            return '302 Found', 'index.php', ''
+
+        error = ''
+        validate = ''
+        if 'submit' in form:
+            raw = {key: stripslashes(form.get(key, '')) for key in
+                   ('username', 'name', 'email', 'password', 'repassword')}
+            escaped = {key: real_escape_string(value) for key, value in raw.items()}
+
+            if all(php_filled(value) for value in escaped.values()):
+                if escaped['password'] == escaped['repassword']:
+                    # cek_nama() is called with $name, not $username
+                    if not self.db.user_exists(raw['name']):
+                        # INSERT uses the undefined $nama, so the name is stored empty
+                        inserted = self.db.add_user(raw['username'], '', raw['email'],
+                                                    password_hash(escaped['password']))
+                        if inserted:
+                            session['username'] = escaped['username']
+                            return '302 Found', 'index.php', ''
+                        error = ERROR_FAILED
+                    else:
+                        error = ERROR_DUPLICATE
+                else:
+                    validate = VALIDATE_MISMATCH
+            else:
+                error = ERROR_EMPTY
+
+        return '200 OK', None, self.pages['register.php'](error=error, validate=validate)
+
+    def index(self, session, form):
+        if 'username' not in session:
+            return '302 Found', 'login.php', ''
+        return '200 OK', None, INDEX_PAGE.format(username=html.escape(session['username']))
+
+    def logout(self, session, form):
+        session.clear()
+        return '302 Found', 'login.php', ''
+
+
+# ==================== SERVER ====================
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Serve `StubApp` on a local port from a background thread"""
+    def __init__(self, db, host='127.0.0.1', port=0):
+        self.app = StubApp(db)
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._server = make_server(self.host, self.port, self.app,
+                                   server_class=_ThreadingWSGIServer,
+                                   handler_class=_QuietHandler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
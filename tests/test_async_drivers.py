@@ -0,0 +1,56 @@
+"""
+Unit tests for async_drivers.py: concurrent login/register
+"""
+import asyncio
+
+import pytest
+
+from async_drivers import AsyncLoginDriver, AsyncMemoryStore, AsyncRegisterDriver, ClientSession
+from conftest import LoginDriver
+from database_stub import DatabaseStub
+
+
+@pytest.mark.stub
+class TestAsyncDrivers:
+    """Many concurrent clients against one stub"""
+
+    def test_same_username_registered_once(self):
+        db = DatabaseStub()
+        register = AsyncRegisterDriver(AsyncMemoryStore(db, latency=0.001), cost=4)
+
+        async def storm():
+            return await asyncio.gather(*(
+                register.attempt_register(ClientSession(), f"Racer {i}", f"racer{i}@test.com",
+                                          "racer", "password", "password")
+                for i in range(50)))
+
+        results = asyncio.run(storm())
+        assert sum(r['success'] for r in results) == 1
+        assert {r['error'] for r in results if not r['success']} == {'Register User Gagal !!'}
+        assert len(db) == 3
+
+    def test_sessions_are_per_client(self):
+        login = AsyncLoginDriver(AsyncMemoryStore(latency=0))
+        irul, ahmad, stranger = ClientSession(), ClientSession(), ClientSession()
+
+        async def log_in():
+            return await asyncio.gather(
+                login.attempt_login(irul, "irul", "irul123"),
+                login.attempt_login(ahmad, "ahmad", "ahmad123"),
+                login.attempt_login(stranger, "irul", "wrongpassword"))
+
+        results = asyncio.run(log_in())
+        assert [r['success'] for r in results] == [True, True, False]
+        assert (irul.username, ahmad.username) == ("irul", "ahmad")
+        assert not stranger.is_logged_in() and results[2]['error'] is None
+
+    def test_results_match_sync_drivers(self):
+        login, sync_login = AsyncLoginDriver(AsyncMemoryStore()), LoginDriver(DatabaseStub())
+        register = AsyncRegisterDriver(AsyncMemoryStore(), cost=4)
+        for username, password in [("", "x"), ("irul", "   "), ("nobody", "x"), ("irul", "irul123")]:
+            assert asyncio.run(login.attempt_login(ClientSession(), username, password)) == \
+                sync_login.attempt_login(username, password)
+        mismatch = asyncio.run(register.attempt_register(ClientSession(), "A", "a@b.co", "new", "p1", "p2"))
+        assert mismatch['validate'] == 'Password tidak sama !!'
+        duplicate = asyncio.run(register.attempt_register(ClientSession(), "irul", "a@b.co", "new", "p", "p"))
+        assert duplicate['error'] == 'Username sudah terdaftar !!'
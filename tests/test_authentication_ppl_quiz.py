@@ -15,20 +15,28 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
 import os
-from datetime import datetime
 
-SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "screenshots", "auth_testing")
-os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+from parallel import worker_screenshot_dir
+import screenshot_service
+from timing_analysis import analyze_login_timing
+from waits import (
+    click_and_wait,
+    find_alert_danger,
+    form_rerendered_after_post,
+    submit_and_wait,
+    wait_for_page_load,
+    wait_until,
+)
+
+SCREENSHOT_DIR = worker_screenshot_dir(os.path.join(os.path.dirname(__file__), "screenshots", "auth_testing"))
 
 def take_screenshot(driver, test_id, step_name):
-    """Capture screenshot with timestamp"""
-    timestamp = datetime.now().strftime("%H%M%S")
-    filename = f"{test_id}_{step_name}_{timestamp}.png"
+    """Capture screenshot (runs are kept apart by the screenshot manifest)"""
+    filename = f"{test_id}_{step_name}.png"
     filepath = os.path.join(SCREENSHOT_DIR, filename)
-    driver.save_screenshot(filepath)
-    print(f"Screenshot saved: {filepath}")
+    screenshot_service.SERVICE.capture(driver, filepath)
+    print(f"Screenshot queued: {filepath}")
 
 
 class TestLoginValidation:
@@ -53,8 +61,7 @@ class TestLoginValidation:
         
         # Submit form
         submit_button = driver.find_element(By.NAME, "submit")
-        submit_button.click()
-        time.sleep(2)
+        click_and_wait(driver, submit_button)
         
         take_screenshot(driver, "FT_001", "after_submit")
         
@@ -75,13 +82,12 @@ class TestLoginValidation:
         take_screenshot(driver, "FT_002", "password_empty")
         
         # Submit with empty password
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_002", "error_message")
         
         # Verify error message appears
-        error_alert = driver.find_element(By.CLASS_NAME, "alert-danger")
+        error_alert = find_alert_danger(driver)
         assert error_alert.is_displayed(), "Error message should be displayed"
         assert "kosong" in error_alert.text.lower() or "tidak boleh" in error_alert.text.lower(), \
             f"Expected 'empty' error message, got: {error_alert.text}"
@@ -99,13 +105,12 @@ class TestLoginValidation:
         take_screenshot(driver, "FT_003", "username_empty")
         
         # Submit with empty username
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_003", "error_message")
         
         # Verify error message
-        error_alert = driver.find_element(By.CLASS_NAME, "alert-danger")
+        error_alert = find_alert_danger(driver)
         assert error_alert.is_displayed(), "Error message should be displayed"
 
     def test_FT_004_login_unregistered_user(self, driver, base_url):
@@ -121,8 +126,7 @@ class TestLoginValidation:
         
         take_screenshot(driver, "FT_004", "unregistered_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_004", "error_message")
         
@@ -144,8 +148,7 @@ class TestLoginValidation:
         
         take_screenshot(driver, "FT_005", "wrong_password_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_005", "error_message")
         
@@ -165,8 +168,7 @@ class TestLoginValidation:
         
         take_screenshot(driver, "FT_006", "mismatched_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_006", "error_message")
         
@@ -190,8 +192,7 @@ class TestLoginValidation:
                 
                 take_screenshot(driver, "FT_007", f"attempt_{attempt}")
                 
-                driver.find_element(By.NAME, "submit").click()
-                time.sleep(1)
+                submit_and_wait(driver, replaces=1)
             except Exception as e:
                 print(f"Attempt {attempt} error: {e}")
                 pass
@@ -202,25 +203,22 @@ class TestLoginValidation:
         # This test documents current behavior
         assert "login.php" in driver.current_url, "Should remain on login page after failures"
 
-    def test_FT_008_session_expired_redirect(self, driver, base_url):
+    def test_FT_008_session_expired_redirect(self, logged_in_driver, base_url):
         """FT_008: Verify expired session redirects to login"""
-        # First, login successfully
-        driver.get(f"{base_url}/login.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        ).send_keys("testuser123")
-        driver.find_element(By.ID, "InputPassword").send_keys("TestPassword123!")
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        # Start from an authenticated session
+        driver = logged_in_driver
+        driver.get(f"{base_url}/index.php")
+        wait_for_page_load(driver)
         
         take_screenshot(driver, "FT_008", "after_login")
+        assert "index.php" in driver.current_url
         
         # Clear session cookies to simulate expiration
         driver.delete_cookie("PHPSESSID")
         
         # Try to access protected page
         driver.get(f"{base_url}/index.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         take_screenshot(driver, "FT_008", "after_session_clear")
         
@@ -231,15 +229,15 @@ class TestLoginValidation:
 class TestRegistrationValidation:
     """FT_009 - FT_017: Registration Validation Tests"""
 
-    def test_FT_009_register_valid_data(self, driver, base_url):
+    def test_FT_009_register_valid_data(self, driver, base_url, unique_names):
         """FT_009: Verify successful registration with valid data"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_009", "initial_page")
         
         # Generate unique email
-        timestamp = int(time.time())
-        unique_user = f"newuser_{timestamp}"
-        unique_email = f"user_{timestamp}@example.com"
+        uid = unique_names.username()
+        unique_user = f"newuser_{uid}"
+        unique_email = f"user_{uid}@example.com"
         
         # Fill registration form
         WebDriverWait(driver, 10).until(
@@ -252,8 +250,7 @@ class TestRegistrationValidation:
         
         take_screenshot(driver, "FT_009", "form_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         
         take_screenshot(driver, "FT_009", "after_submit")
         
@@ -261,25 +258,24 @@ class TestRegistrationValidation:
         assert "index.php" in driver.current_url or "register.php" not in driver.current_url, \
             f"Expected redirect after registration, got {driver.current_url}"
 
-    def test_FT_010_register_empty_email(self, driver, base_url):
+    def test_FT_010_register_empty_email(self, driver, base_url, unique_names):
         """FT_010: Verify registration fails when email is empty"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_010", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         # Email left empty intentionally
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "FT_010", "form_without_email")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_010", "error_message")
         
@@ -287,51 +283,49 @@ class TestRegistrationValidation:
         error_alerts = driver.find_elements(By.CLASS_NAME, "alert-danger")
         assert len(error_alerts) > 0, "Error message should appear"
 
-    def test_FT_011_register_empty_username(self, driver, base_url):
+    def test_FT_011_register_empty_username(self, driver, base_url, unique_names):
         """FT_011: Verify registration fails when username is empty"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_011", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
         # Username left empty
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "FT_011", "form_without_username")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_011", "error_message")
         
         error_alerts = driver.find_elements(By.CLASS_NAME, "alert-danger")
         assert len(error_alerts) > 0, "Error message should appear"
 
-    def test_FT_012_register_duplicate_username(self, driver, base_url):
+    def test_FT_012_register_duplicate_username(self, driver, base_url, unique_names):
         """FT_012: Verify registration fails when username already exists"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_012", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         # Try to register with existing username
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"duplicate_{timestamp}@example.com")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"duplicate_{uid}@example.com")
         driver.find_element(By.ID, "username").send_keys("testuser123")  # Existing user
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "FT_012", "form_with_duplicate_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_012", "error_message")
         
@@ -339,25 +333,24 @@ class TestRegistrationValidation:
         error_alerts = driver.find_elements(By.CLASS_NAME, "alert-danger")
         assert len(error_alerts) > 0, "Duplicate username error should appear"
 
-    def test_FT_013_register_password_mismatch(self, driver, base_url):
+    def test_FT_013_register_password_mismatch(self, driver, base_url, unique_names):
         """FT_013: Verify registration fails when passwords don't match"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_013", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("DifferentPass456!")
         
         take_screenshot(driver, "FT_013", "mismatched_passwords")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_013", "error_message")
         
@@ -365,76 +358,73 @@ class TestRegistrationValidation:
         password_errors = driver.find_elements(By.XPATH, "//*[contains(text(), 'Password') and contains(text(), 'sama')]")
         assert len(password_errors) > 0, "Password mismatch error should appear"
 
-    def test_FT_014_register_empty_password(self, driver, base_url):
+    def test_FT_014_register_empty_password(self, driver, base_url, unique_names):
         """FT_014: Verify registration fails when password is empty"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_014", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         # Both password fields left empty
         
         take_screenshot(driver, "FT_014", "form_without_password")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_014", "error_message")
         
         error_alerts = driver.find_elements(By.CLASS_NAME, "alert-danger")
         assert len(error_alerts) > 0, "Error message should appear"
 
-    def test_FT_015_register_invalid_email_format(self, driver, base_url):
+    def test_FT_015_register_invalid_email_format(self, driver, base_url, unique_names):
         """FT_015: Verify registration fails with invalid email format"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_015", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
         # Invalid email format
         driver.find_element(By.ID, "InputEmail").send_keys("not_an_email_format")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "FT_015", "invalid_email_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_015", "error_message")
         
         # HTML5 validation should prevent submission or server should reject
         assert "register.php" in driver.current_url, "Should remain on register page"
 
-    def test_FT_016_register_long_password(self, driver, base_url):
+    def test_FT_016_register_long_password(self, driver, base_url, unique_names):
         """FT_016: Verify registration with long password (edge case)"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_016", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         long_password = "VeryLongSecurePassword123!@#$%^&*()_+-=[]{}|;:',.<>?/" * 3  # Very long password
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         driver.find_element(By.ID, "InputPassword").send_keys(long_password)
         driver.find_element(By.ID, "InputRePassword").send_keys(long_password)
         
         take_screenshot(driver, "FT_016", "long_password_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         
         take_screenshot(driver, "FT_016", "after_submit")
         
@@ -442,26 +432,25 @@ class TestRegistrationValidation:
         # Document behavior
         print(f"Current URL after long password: {driver.current_url}")
 
-    def test_FT_017_register_special_characters_username(self, driver, base_url):
+    def test_FT_017_register_special_characters_username(self, driver, base_url, unique_names):
         """FT_017: Verify registration with special characters in username"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "FT_017", "initial_page")
         
-        timestamp = int(time.time())
-        special_username = f"user_{timestamp}_!@#$"
+        uid = unique_names.username()
+        special_username = f"user_{uid}_!@#$"
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
         driver.find_element(By.ID, "username").send_keys(special_username)
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "FT_017", "special_chars_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "FT_017", "after_submit")
         
@@ -484,8 +473,7 @@ class TestNavigationUI:
         
         take_screenshot(driver, "FT_018", "login_link_found")
         
-        login_link.click()
-        time.sleep(1)
+        click_and_wait(driver, login_link, replaces=1)
         
         take_screenshot(driver, "FT_018", "after_click")
         
@@ -523,16 +511,12 @@ class TestNavigationUI:
         assert login_link.is_displayed(), "Login link should be visible"
         assert "login.php" in login_link.get_attribute("href"), "Link should point to login.php"
 
-    def test_FT_021_logout_and_page_protection(self, driver, base_url):
+    def test_FT_021_logout_and_page_protection(self, logged_in_driver, auth_session, base_url):
         """FT_021: Verify logout process and page protection"""
-        # First, login
-        driver.get(f"{base_url}/login.php")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        ).send_keys("testuser123")
-        driver.find_element(By.ID, "InputPassword").send_keys("TestPassword123!")
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        # Start from an authenticated session
+        driver = logged_in_driver
+        driver.get(f"{base_url}/index.php")
+        wait_for_page_load(driver)
         
         take_screenshot(driver, "FT_021", "after_login")
         
@@ -542,8 +526,9 @@ class TestNavigationUI:
                 EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'Logout')] | //button[contains(text(), 'Logout')]"))
             )
             take_screenshot(driver, "FT_021", "logout_button_found")
-            logout_button.click()
-            time.sleep(1)
+            click_and_wait(driver, logout_button, replaces=1)
+            # The shared session has been destroyed server-side
+            auth_session.invalidate()
         except:
             print("No logout button found, checking page protection")
         
@@ -552,7 +537,7 @@ class TestNavigationUI:
         # Try to access protected page without login
         driver.delete_cookie("PHPSESSID")
         driver.get(f"{base_url}/index.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         take_screenshot(driver, "FT_021", "protected_page_access")
         
@@ -578,8 +563,7 @@ class TestSecurityVulnerabilities:
         
         take_screenshot(driver, "SECURITY_001", "sql_injection_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_001", "after_submit")
         
@@ -600,33 +584,31 @@ class TestSecurityVulnerabilities:
         
         take_screenshot(driver, "SECURITY_002", "sql_injection_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_002", "after_submit")
         
         assert "login.php" in driver.current_url, "Should remain on login page, SQL injection should fail"
 
-    def test_SECURITY_003_sql_injection_register_username(self, driver, base_url):
+    def test_SECURITY_003_sql_injection_register_username(self, driver, base_url, unique_names):
         """SECURITY_003: Verify SQL injection protection in register username field"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "SECURITY_003", "initial_page")
         
-        timestamp = int(time.time())
-        sql_injection = f"test_{timestamp}' DROP TABLE users --"
+        uid = unique_names.username()
+        sql_injection = f"test_{uid}' DROP TABLE users --"
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
         driver.find_element(By.ID, "username").send_keys(sql_injection)
         driver.find_element(By.ID, "InputPassword").send_keys("TestPass123!")
         driver.find_element(By.ID, "InputRePassword").send_keys("TestPass123!")
         
         take_screenshot(driver, "SECURITY_003", "sql_injection_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_003", "after_submit")
         
@@ -647,8 +629,7 @@ class TestSecurityVulnerabilities:
         
         take_screenshot(driver, "SECURITY_004", "xss_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_004", "after_submit")
         
@@ -678,61 +659,42 @@ class TestSecurityVulnerabilities:
         
         assert field_type == "password", f"Password field type should be 'password', got '{field_type}'"
 
-    def test_SECURITY_006_weak_password_detection(self, driver, base_url):
+    def test_SECURITY_006_weak_password_detection(self, driver, base_url, unique_names):
         """SECURITY_006: Verify system handles weak password scenarios"""
         driver.get(f"{base_url}/register.php")
         take_screenshot(driver, "SECURITY_006", "initial_page")
         
-        timestamp = int(time.time())
+        uid = unique_names.username()
         weak_password = "123"  # Very weak password
         
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "name"))
         ).send_keys("Test User")
-        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{timestamp}@example.com")
-        driver.find_element(By.ID, "username").send_keys(f"testuser_{timestamp}")
+        driver.find_element(By.ID, "InputEmail").send_keys(f"user_{uid}@example.com")
+        driver.find_element(By.ID, "username").send_keys(f"testuser_{uid}")
         driver.find_element(By.ID, "InputPassword").send_keys(weak_password)
         driver.find_element(By.ID, "InputRePassword").send_keys(weak_password)
         
         take_screenshot(driver, "SECURITY_006", "weak_password_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_006", "after_submit")
         
         # Document if weak password is rejected or accepted
         print("Weak password handling - document result")
 
-    def test_SECURITY_007_response_timing_attacks(self, driver, base_url):
-        """SECURITY_007: Verify timing is consistent for login attempts"""
-        driver.get(f"{base_url}/login.php")
-        
-        import time
-        times = []
+    def test_SECURITY_007_response_timing_attacks(self, base_url, pytestconfig):
+        """SECURITY_007: Check whether login.php response times reveal existing usernames"""
+        # Raw HTTP, interleaved samples and Welch/KS tests (see timing_analysis.py)
+        report = analyze_login_timing(base_url, existing_user="irul",
+                                      missing_user="nonexistentuser999999",
+                                      max_samples=pytestconfig.getoption("--timing-samples"))
         
-        # Test valid username with wrong password - should take longer
-        for i in range(3):
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            driver.find_element(By.ID, "username").clear()
-            driver.find_element(By.ID, "InputPassword").clear()
-            
-            start = time.time()
-            driver.find_element(By.ID, "username").send_keys("testuser123")
-            driver.find_element(By.ID, "InputPassword").send_keys("wrongpass")
-            driver.find_element(By.NAME, "submit").click()
-            elapsed = time.time() - start
-            times.append(elapsed)
-            
-            time.sleep(1)
-            driver.get(f"{base_url}/login.php")
-        
-        take_screenshot(driver, "SECURITY_007", "timing_test_complete")
+        assert min(len(values) for values in report.samples.values()) >= 50
         
         # Document timing results
-        print(f"Timing measurements: {times}")
+        print(report.summary())
 
     def test_SECURITY_008_account_enumeration(self, driver, base_url):
         """SECURITY_008: Verify account enumeration is not possible"""
@@ -744,8 +706,7 @@ class TestSecurityVulnerabilities:
             EC.presence_of_element_located((By.ID, "username"))
         ).send_keys("testuser123")
         driver.find_element(By.ID, "InputPassword").send_keys("wrongpass")
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_008", "existing_user_error")
         error_existing = driver.find_element(By.CLASS_NAME, "alert-danger").text if driver.find_elements(By.CLASS_NAME, "alert-danger") else ""
@@ -756,8 +717,7 @@ class TestSecurityVulnerabilities:
             EC.presence_of_element_located((By.ID, "username"))
         ).send_keys("nonexistentuser999999")
         driver.find_element(By.ID, "InputPassword").send_keys("wrongpass")
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         
         take_screenshot(driver, "SECURITY_008", "nonexistent_user_error")
         error_nonexisting = driver.find_element(By.CLASS_NAME, "alert-danger").text if driver.find_elements(By.CLASS_NAME, "alert-danger") else ""
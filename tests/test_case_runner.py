@@ -0,0 +1,40 @@
+"""
+Unit tests for form_cases.py: case loading and CaseRunner
+"""
+import pytest
+
+from form_cases import CaseRunner, FormCase, load_cases
+from form_client import HttpFormClient
+from parallel import UniqueNames
+
+
+@pytest.mark.stub
+class TestFormCases:
+    """Table-driven cases: spec expansion and shared page loads"""
+
+    def test_spec_expansion(self, tmp_path):
+        spec = tmp_path / "cases.json"
+        spec.write_text('{"cases": [{"id": "X_{n}", "page": "login.php", "payloads": ["a", "b"],'
+                        ' "fields": {"username": "{payload}{repeat:z:3}"}, "expect": {"error": null},'
+                        ' "browser": {"page": "login.php"}}]}')
+        cases = load_cases(str(spec))
+        assert [(c.id, c.fields) for c in cases] == [("X_01", {"username": "azzz"}),
+                                                      ("X_02", {"username": "bzzz"})]
+        assert cases[0].expected("http") == {"error": None}
+        assert cases[0].expected("browser") == {"error": None, "page": "login.php"}
+        assert load_cases(str(spec)) is cases
+
+    def test_failed_submits_share_the_rendered_form(self, server):
+        client = HttpFormClient(server.url)
+        runner = CaseRunner(client, UniqueNames())
+        empty = FormCase("E", "login.php", {}, {"error": "Data tidak boleh kosong !!"})
+        unknown = FormCase("U", "login.php", {"username": "nobody", "password": "x"},
+                           {"error": "Register User Gagal !!"})
+        valid = FormCase("V", "login.php", {"username": "irul", "password": "irul123"},
+                         {"page": "index.php"})
+
+        for case in (empty, unknown, empty, valid, unknown):
+            assert runner.run(case) == []
+        # One load up front, one after the redirect to index.php
+        assert runner.page_loads == 2
+        assert runner.run(FormCase("W", "login.php", {}, {"error": "wrong"})) != []
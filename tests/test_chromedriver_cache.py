@@ -0,0 +1,42 @@
+"""
+Unit tests for chromedriver_cache.py: offline chromedriver resolution
+"""
+import pytest
+
+import chromedriver_cache
+
+
+@pytest.mark.stub
+class TestChromedriverCache:
+    """Offline resolution of the chromedriver path"""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, monkeypatch):
+        monkeypatch.delenv('CHROMEDRIVER_PATH', raising=False)
+        chromedriver_cache.resolve_chromedriver_path.cache_clear()
+        yield
+        chromedriver_cache.resolve_chromedriver_path.cache_clear()
+
+    def test_environment_variable_wins(self, tmp_path, monkeypatch):
+        binary = tmp_path / 'chromedriver-env'
+        binary.write_text('')
+        monkeypatch.setenv('CHROMEDRIVER_PATH', str(binary))
+        monkeypatch.setattr(chromedriver_cache.shutil, 'which', lambda name: '/usr/bin/chromedriver')
+        assert chromedriver_cache.resolve_chromedriver_path() == str(binary)
+
+    def test_path_lookup_is_not_persisted(self, tmp_path, monkeypatch):
+        binary = tmp_path / 'chromedriver'
+        binary.write_text('')
+        monkeypatch.setattr(chromedriver_cache.shutil, 'which', lambda name: str(binary))
+        assert chromedriver_cache.resolve_chromedriver_path() == str(binary)
+
+        # A new session sees the changed PATH
+        chromedriver_cache.resolve_chromedriver_path.cache_clear()
+        monkeypatch.setattr(chromedriver_cache.shutil, 'which', lambda name: None)
+        with pytest.raises(RuntimeError, match="CHROMEDRIVER_PATH"):
+            chromedriver_cache.resolve_chromedriver_path()
+
+    def test_missing_environment_path_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('CHROMEDRIVER_PATH', str(tmp_path / 'missing'))
+        with pytest.raises(RuntimeError, match="is not a file"):
+            chromedriver_cache.resolve_chromedriver_path()
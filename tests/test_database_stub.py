@@ -0,0 +1,89 @@
+"""
+Unit tests for database_stub.py: the in-memory users table
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import SYNTH
+from database_stub import DatabaseStub, UserRecord
+
+
+@pytest.mark.stub
+class TestDatabaseStub:
+    """Indexed, thread-safe user store"""
+
+    def test_ids_and_secondary_indexes(self):
+        db = DatabaseStub()
+        assert db.add_user("budi", "", "budi@test.com", "hash")
+        assert not db.add_user("budi", "", "other@test.com", "hash")
+
+        user = db.get_user("budi")
+        assert user['id'] == 3
+        assert db.get_user_by_id(3) is user
+        assert db.get_user_by_email("budi@test.com") is user
+        assert db.get_user("BUDI") is user
+
+    def test_unique_email(self):
+        db = DatabaseStub()
+        assert not db.add_user("budi", "", "Irul@irul.com ", "hash")
+        assert db.bulk_load([dict(SYNTH, id=10, username='budi', email='AHMAD@ahmad.com')]) == 0
+        assert len(db) == 2 and db.get_user("budi") is None
+
+    def test_user_record_dict_access(self):
+        user = DatabaseStub().get_user("irul")
+        assert isinstance(user, UserRecord)
+        assert user['username'] == 'irul' and user.get('email') == 'irul@irul.com'
+        assert user.get('missing') is None and 'password' in user
+        assert user == {'id': 1, 'name': '', 'username': 'irul', 'email': 'irul@irul.com',
+                        'password': user.password}
+        with pytest.raises(KeyError):
+            user['missing']
+        assert not hasattr(user, '__dict__')
+
+    def test_general_ci_collation(self):
+        db = DatabaseStub()
+        assert db.get_user("IRUL ")['username'] == 'irul'
+        assert db.get_user_by_email("Irul@Irul.com")['id'] == 1
+        assert not db.add_user("Ahmad", "", "a@test.com", "hash")
+
+    def test_binary_collation(self):
+        db = DatabaseStub(collation='binary')
+        assert db.get_user("IRUL") is None
+        assert db.add_user("Ahmad", "", "Ahmad@ahmad.com", "hash")
+
+    def test_concurrent_registrations_of_one_username(self):
+        db = DatabaseStub()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda i: db.add_user("race", "", f"r{i}@test.com", "hash"), range(200)))
+        assert results.count(True) == 1
+        assert len(db) == 3
+
+    def test_clear_keeps_seed_users_and_counter(self):
+        db = DatabaseStub()
+        for i in range(1000):
+            db.add_user(f"user{i}", "", f"user{i}@test.com", "hash")
+        db.clear_test_users()
+
+        assert sorted(db.users) == ["ahmad", "irul"]
+        assert db.get_user_by_email("user1@test.com") is None
+        db.add_user("next", "", "next@test.com", "hash")
+        assert db.get_user("next")['id'] == 1003
+
+    def test_fork_is_copy_on_write(self):
+        base = DatabaseStub()
+        for i in range(1000):
+            base.add_user(f"user{i}", "", f"user{i}@test.com", "hash")
+        fork = base.fork()
+        assert fork.users.maps[1] is base.users
+
+        assert fork.add_user("forked", "", "forked@test.com", "hash")
+        assert fork.get_user("forked")['id'] == 1003
+        assert fork.get_user("user5") is base.get_user("user5")
+        assert len(fork) == 1003 and len(base) == 1002
+        assert base.get_user("forked") is None
+
+        fork.restore()
+        assert fork.get_user("forked") is None and len(fork) == 1002
+        assert fork.add_user("forked", "", "forked@test.com", "hash")
+        assert fork.get_user("forked")['id'] == 1003
@@ -0,0 +1,56 @@
+"""
+Unit tests for driver_pool.py: checkout/checkin, reset and recycling
+"""
+import pytest
+
+from conftest import FakeDriver
+from driver_pool import DriverPool
+
+
+@pytest.mark.stub
+class TestDriverPool:
+    """Checkout/checkin, reset and recycling of pooled drivers"""
+
+    def test_driver_is_reused_and_reset(self):
+        pool = DriverPool(FakeDriver, size=1)
+        first = pool.checkout()
+        first.current_url = 'http://localhost/login.php'
+        first.execute_script = lambda script: None
+        pool.checkin(first)
+
+        second = pool.checkout()
+        assert second is first
+        assert second.current_url == 'about:blank'
+        assert second.cookies_cleared == 1
+        assert pool.stats['created'] == 1
+
+    def test_crashed_driver_is_recycled(self):
+        pool = DriverPool(FakeDriver, size=1)
+        first = pool.checkout()
+        first.crashed = True
+        pool.checkin(first)
+
+        second = pool.checkout()
+        assert second is not first
+        assert first.quit_called
+        assert pool.stats['recycled'] == 1
+
+    def test_driver_recycled_after_max_uses(self):
+        pool = DriverPool(FakeDriver, size=1, max_uses=2)
+        first = pool.checkout()
+        pool.checkin(first)
+        assert pool.checkout() is first
+        pool.checkin(first)
+
+        assert pool.checkout() is not first
+        assert first.quit_called
+
+    def test_exhausted_pool_starts_overflow_driver(self):
+        pool = DriverPool(FakeDriver, size=1, overflow_wait=0.01)
+        held = pool.checkout()
+        extra = pool.checkout()
+        assert extra is not held and pool.stats['overflow'] == 1
+        pool.checkin(extra)
+        assert extra.quit_called and not held.quit_called
+        pool.checkin(held)
+        assert pool.checkout() is held and pool.stats['created'] == 1
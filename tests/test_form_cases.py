@@ -0,0 +1,16 @@
+"""
+Table-driven login/register cases from cases/form_cases.json.
+Each case runs in browser mode, HTTP mode or both (--client-mode); see
+form_cases.py for the spec format.
+"""
+import pytest
+
+from form_cases import load_cases
+
+CASES = load_cases()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.id for case in CASES])
+def test_form_case(case, case_runner):
+    failures = case_runner.run(case)
+    assert not failures, f"{case.id} ({case.description}): " + "; ".join(failures)
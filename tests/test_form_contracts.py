@@ -0,0 +1,61 @@
+"""
+Form contract tests for login.php and register.php.
+Each test runs in browser mode, HTTP mode or both (--client-mode).
+"""
+
+
+class TestLoginFormContract:
+    """Login form: one POST, one response"""
+
+    def test_valid_credentials_redirect_to_index(self, form_client):
+        """Valid credentials redirect to index.php"""
+        form_client.open("login.php").submit(username="irul", password="irul123")
+        assert form_client.on_page("index.php")
+
+    def test_empty_password_error(self, form_client):
+        """Empty password shows 'Data tidak boleh kosong !!'"""
+        form_client.open("login.php").submit(username="irul", password="")
+        assert form_client.on_page("login.php")
+        assert form_client.error_text() == "Data tidak boleh kosong !!"
+
+    def test_unknown_user_error(self, form_client):
+        """Unknown username shows 'Register User Gagal !!'"""
+        form_client.open("login.php").submit(username="nonexistentuser", password="anypassword")
+        assert form_client.on_page("login.php")
+        assert form_client.error_text() == "Register User Gagal !!"
+
+    def test_wrong_password_stays_on_login(self, form_client):
+        """Wrong password keeps the user on login.php"""
+        form_client.open("login.php").submit(username="irul", password="wrongpassword")
+        assert form_client.on_page("login.php")
+
+    def test_sql_injection_does_not_log_in(self, form_client):
+        """Comment-based SQL injection does not log in"""
+        form_client.open("login.php").submit(username="admin'--", password="anything")
+        assert form_client.on_page("login.php")
+
+
+class TestRegisterFormContract:
+    """Register form: one POST, one response"""
+
+    def test_all_fields_empty_error(self, form_client):
+        """Submitting an empty form shows 'Data tidak boleh kosong !!'"""
+        form_client.open("register.php").submit()
+        assert form_client.on_page("register.php")
+        assert form_client.error_text() == "Data tidak boleh kosong !!"
+
+    def test_password_mismatch_validation(self, form_client, unique_names):
+        """Different passwords show 'Password tidak sama !!' under both fields"""
+        username = unique_names.username("mis")
+        form_client.open("register.php").submit(
+            name="Test User", email=f"{username}@test.com", username=username,
+            password="password1", repassword="password2")
+        assert form_client.validate_texts() == ["Password tidak sama !!"] * 2
+
+    def test_name_matching_existing_username(self, form_client, unique_names):
+        """BUG: cek_nama checks the name field against existing usernames"""
+        username = unique_names.username("dup")
+        form_client.open("register.php").submit(
+            name="irul", email=f"{username}@test.com", username=username,
+            password="password", repassword="password")
+        assert form_client.error_text() == "Username sudah terdaftar !!"
@@ -0,0 +1,34 @@
+"""
+Unit tests for loadgen.py: the HTTP load generator
+"""
+import pytest
+
+from loadgen import LoadGenerator, LoadProfile, LoadResult
+
+
+@pytest.mark.stub
+class TestLoadGenerator:
+    """Open-loop login/register load"""
+
+    def test_percentiles_nearest_rank(self):
+        result = LoadResult()
+        for ms in range(1, 101):
+            result.record('login_valid', ms / 1000, ok=True)
+        assert result.percentiles() == {50: 0.05, 95: 0.095, 99: 0.099}
+
+    def test_mixed_load_against_stub_server(self, server):
+        profile = LoadProfile(rate=20, duration=0.5, register_ratio=0.2, seed=7)
+        result = LoadGenerator(server.url, profile).run()
+
+        assert result.completed == result.scheduled > 0
+        assert not result.errors and not result.failures
+        assert result.throughput > 0
+
+    def test_page_views_and_connection_count(self, server):
+        profile = LoadProfile(rate=40, duration=0.5, page_ratio=0.5, seed=3)
+        result = LoadGenerator(server.url, profile).run()
+
+        assert result.latencies['page_view'] and not result.failures
+        # wsgiref closes after each response; a pooled connection is only counted once
+        assert 0 < result.connections <= result.completed
+        assert f"{result.connections} client connections" in result.summary()
@@ -0,0 +1,47 @@
+"""
+Unit tests for parallel.py: xdist helpers
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from parallel import UniqueNames
+
+
+@pytest.mark.stub
+class TestParallelHelpers:
+    """Per-worker test data namespaces"""
+
+    def test_names_unique_within_worker(self):
+        names = UniqueNames(worker='gw3')
+        generated = {names.username("test") for _ in range(1000)}
+        assert len(generated) == 1000
+        assert all(len(name) <= 50 for name in generated)
+
+    def test_workers_get_distinct_namespaces(self):
+        assert UniqueNames(worker='gw0').namespace != UniqueNames(worker='gw1').namespace
+
+    def test_email_uses_username(self):
+        email = UniqueNames(worker='main').email("reg", domain="example.com")
+        assert email.startswith("reg") and email.endswith("@example.com")
+
+    def test_loadgroup_slots_assigned_on_workers(self, tmp_path):
+        # Through conftest's collection hook in real xdist workers
+        (tmp_path / "test_slots.py").write_text(
+            "import pytest\n"
+            "@pytest.fixture\n"
+            "def driver():\n"
+            "    yield None\n"
+            "@pytest.mark.parametrize('n', range(4))\n"
+            "def test_browser(driver, request, n):\n"
+            "    assert '@slot' in request.node.nodeid\n"
+            "def test_plain(request):\n"
+            "    assert '@' not in request.node.nodeid\n")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "conftest",
+                               "-n", "2", "--dist", "loadgroup", "--rootdir", str(tmp_path), str(tmp_path)],
+                              cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120)
+        assert proc.returncode == 0, proc.stdout + proc.stderr
+        assert "5 passed" in proc.stdout
@@ -0,0 +1,38 @@
+"""
+Unit tests for passwords.py: password_verify() and hashing
+"""
+import pytest
+
+from conftest import LoginDriver
+from passwords import PasswordVerifier, password_hash
+
+
+@pytest.mark.stub
+class TestPasswordVerification:
+    """LoginDriver checks passwords like password_verify()"""
+
+    def test_wrong_password_fails_without_error(self, login_driver):
+        result = login_driver.attempt_login("irul", "wrongpassword")
+        assert result == {'success': False, 'error': None, 'redirect': None}
+        assert not login_driver.is_logged_in()
+        assert login_driver.attempt_login("ahmad", "ahmad123")['success']
+        assert login_driver.is_logged_in()
+
+    def test_cache_is_bounded_lru(self):
+        verifier = PasswordVerifier(cache_size=2)
+        hashed = password_hash("secret", cost=4)
+        assert verifier.verify("secret", hashed)
+        assert verifier.verify("secret", hashed)
+        assert not verifier.verify("other", hashed)
+        assert not verifier.verify("third", hashed)
+        assert (verifier.hits, verifier.misses) == (1, 3)
+        assert len(verifier._cache) == 2 and (hashed, "secret") not in verifier._cache
+
+    def test_batch_on_thread_pool(self, db_stub):
+        verifier = PasswordVerifier(workers=4)
+        driver = LoginDriver(db_stub, verifier)
+        results = driver.attempt_logins([("irul", "irul123"), ("irul", "nope"),
+                                         ("ahmad", "ahmad123"), ("ghost", "x")] * 4)
+        verifier.close()
+        assert [r['success'] for r in results[:4]] == [True, False, True, False]
+        assert verifier.hits + verifier.misses == 12
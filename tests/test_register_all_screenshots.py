@@ -8,29 +8,36 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
-import time
 import os
 
-SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "screenshots", "register")
-os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+from parallel import worker_screenshot_dir
+import screenshot_service
+from waits import (
+    click_and_wait,
+    focus_on,
+    submit_and_wait,
+    wait_for_page_load,
+    wait_until,
+)
+
+SCREENSHOT_DIR = worker_screenshot_dir(os.path.join(os.path.dirname(__file__), "screenshots", "register"))
 
 def screenshot(driver, name):
     """Save screenshot with test name"""
     filepath = os.path.join(SCREENSHOT_DIR, f"{name}.png")
-    driver.save_screenshot(filepath)
-    return filepath
+    return screenshot_service.SERVICE.capture(driver, filepath)
 
 
 class TestRegisterFunctionalPositive:
     """TC_REG_001 - TC_REG_002: Positive functional tests"""
     
-    def test_TC_REG_001_valid_registration(self, driver, base_url):
+    def test_TC_REG_001_valid_registration(self, driver, base_url, unique_names):
         """TC_REG_001: Verify successful registration with all valid data"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         screenshot(driver, "TC_REG_001_01_page")
         
-        unique_user = f"test{int(time.time())}"
+        unique_user = unique_names.username("test")
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique_user}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique_user)
@@ -38,16 +45,15 @@ class TestRegisterFunctionalPositive:
         driver.find_element(By.ID, "InputRePassword").send_keys("Test@123")
         screenshot(driver, "TC_REG_001_02_filled")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_001_03_result")
     
-    def test_TC_REG_002_minimum_valid_data(self, driver, base_url):
+    def test_TC_REG_002_minimum_valid_data(self, driver, base_url, unique_names):
         """TC_REG_002: Verify registration with minimum required data"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique_user = f"u{int(time.time())}"
+        unique_user = unique_names.username("u")
         driver.find_element(By.ID, "name").send_keys("A")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique_user}@t.co")
         driver.find_element(By.ID, "username").send_keys(unique_user)
@@ -55,8 +61,7 @@ class TestRegisterFunctionalPositive:
         driver.find_element(By.ID, "InputRePassword").send_keys("1")
         screenshot(driver, "TC_REG_002_01_minimum")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_002_02_result")
 
 
@@ -66,7 +71,7 @@ class TestRegisterEmptyFields:
     def test_TC_REG_003_empty_name(self, driver, base_url):
         """TC_REG_003: Verify validation for empty name"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
         driver.find_element(By.ID, "username").send_keys("testuser")
@@ -74,8 +79,7 @@ class TestRegisterEmptyFields:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_003_01_empty_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_003_02_result")
         
         assert "register.php" in driver.current_url
@@ -83,7 +87,7 @@ class TestRegisterEmptyFields:
     def test_TC_REG_004_empty_email(self, driver, base_url):
         """TC_REG_004: Verify validation for empty email"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "username").send_keys("testuser")
@@ -91,8 +95,7 @@ class TestRegisterEmptyFields:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_004_01_empty_email")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_004_02_result")
         
         assert "register.php" in driver.current_url
@@ -100,7 +103,7 @@ class TestRegisterEmptyFields:
     def test_TC_REG_005_empty_username(self, driver, base_url):
         """TC_REG_005: Verify validation for empty username"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
@@ -108,8 +111,7 @@ class TestRegisterEmptyFields:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_005_01_empty_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_005_02_result")
         
         assert "register.php" in driver.current_url
@@ -117,7 +119,7 @@ class TestRegisterEmptyFields:
     def test_TC_REG_006_empty_password(self, driver, base_url):
         """TC_REG_006: Verify validation for empty password"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
@@ -125,8 +127,7 @@ class TestRegisterEmptyFields:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_006_01_empty_pass")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_006_02_result")
         
         assert "register.php" in driver.current_url
@@ -134,7 +135,7 @@ class TestRegisterEmptyFields:
     def test_TC_REG_007_empty_repassword(self, driver, base_url):
         """TC_REG_007: Verify validation for empty re-password"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
@@ -142,8 +143,7 @@ class TestRegisterEmptyFields:
         driver.find_element(By.ID, "InputPassword").send_keys("password")
         screenshot(driver, "TC_REG_007_01_empty_repass")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_007_02_result")
         
         assert "register.php" in driver.current_url
@@ -151,11 +151,10 @@ class TestRegisterEmptyFields:
     def test_TC_REG_008_all_fields_empty(self, driver, base_url):
         """TC_REG_008: Verify validation when all fields empty"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         screenshot(driver, "TC_REG_008_01_all_empty")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_008_02_result")
         
         assert "register.php" in driver.current_url
@@ -167,7 +166,7 @@ class TestRegisterPasswordValidation:
     def test_TC_REG_009_password_mismatch(self, driver, base_url):
         """TC_REG_009: Verify validation when passwords don't match"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
@@ -176,8 +175,7 @@ class TestRegisterPasswordValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password2")
         screenshot(driver, "TC_REG_009_01_mismatch")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_009_02_result")
         
         page_source = driver.page_source.lower()
@@ -186,7 +184,7 @@ class TestRegisterPasswordValidation:
     def test_TC_REG_010_password_case_difference(self, driver, base_url):
         """TC_REG_010: Verify case sensitivity in password match"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com")
@@ -195,8 +193,7 @@ class TestRegisterPasswordValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password123")
         screenshot(driver, "TC_REG_010_01_case_diff")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_010_02_result")
         
         assert "register.php" in driver.current_url
@@ -208,7 +205,7 @@ class TestRegisterDuplicateValidation:
     def test_TC_REG_011_duplicate_name_field_bug(self, driver, base_url):
         """TC_REG_011: BUG - cek_nama checks name field instead of username"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         # Name = irul (matches existing username - BUG)
         # Username = unique
@@ -219,8 +216,7 @@ class TestRegisterDuplicateValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_011_01_bug_input")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_011_02_bug_result")
         
         # Due to bug, it shows "Username sudah terdaftar" even for unique username
@@ -232,7 +228,7 @@ class TestRegisterEmailValidation:
     def test_TC_REG_012_invalid_email_no_at(self, driver, base_url):
         """TC_REG_012: Verify email format validation (no @)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("invalidemail.com")
@@ -241,8 +237,7 @@ class TestRegisterEmailValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_012_01_no_at")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         screenshot(driver, "TC_REG_012_02_result")
         
         assert "register.php" in driver.current_url
@@ -250,7 +245,7 @@ class TestRegisterEmailValidation:
     def test_TC_REG_013_invalid_email_no_domain(self, driver, base_url):
         """TC_REG_013: Verify email format validation (no domain)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys("test@")
@@ -259,18 +254,17 @@ class TestRegisterEmailValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_013_01_no_domain")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(1)
+        submit_and_wait(driver, replaces=1)
         screenshot(driver, "TC_REG_013_02_result")
         
         assert "register.php" in driver.current_url
     
-    def test_TC_REG_014_valid_email_subdomain(self, driver, base_url):
+    def test_TC_REG_014_valid_email_subdomain(self, driver, base_url, unique_names):
         """TC_REG_014: Verify email with subdomain accepted"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"sub{int(time.time())}"
+        unique = unique_names.username("sub")
         driver.find_element(By.ID, "name").send_keys("Test User")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@mail.domain.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -278,20 +272,19 @@ class TestRegisterEmailValidation:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_014_01_subdomain")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_014_02_result")
 
 
 class TestRegisterBoundaryValue:
     """TC_REG_015 - TC_REG_020: Boundary Value Analysis"""
     
-    def test_TC_REG_015_name_min_length(self, driver, base_url):
+    def test_TC_REG_015_name_min_length(self, driver, base_url, unique_names):
         """TC_REG_015: Verify minimum name length (1 char)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"min{int(time.time())}"
+        unique = unique_names.username("min")
         driver.find_element(By.ID, "name").send_keys("A")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -299,16 +292,15 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_015_01_min_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_015_02_result")
     
-    def test_TC_REG_016_name_max_length(self, driver, base_url):
+    def test_TC_REG_016_name_max_length(self, driver, base_url, unique_names):
         """TC_REG_016: Verify maximum name length (70 chars)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"max{int(time.time())}"
+        unique = unique_names.username("max")
         long_name = "A" * 70
         driver.find_element(By.ID, "name").send_keys(long_name)
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
@@ -317,14 +309,13 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_016_01_max_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_016_02_result")
     
     def test_TC_REG_017_name_exceed_max(self, driver, base_url):
         """TC_REG_017: Verify handling of oversized name (100 chars)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         very_long = "A" * 100
         driver.find_element(By.ID, "name").send_keys(very_long)
@@ -334,14 +325,13 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_017_01_exceed_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_017_02_result")
     
     def test_TC_REG_018_username_min_length(self, driver, base_url):
         """TC_REG_018: Verify minimum username length (1 char)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test")
         driver.find_element(By.ID, "InputEmail").send_keys("a@t.co")
@@ -350,14 +340,13 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_018_01_min_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_018_02_result")
     
     def test_TC_REG_019_username_exceed_max(self, driver, base_url):
         """TC_REG_019: Verify handling of oversized username (100 chars)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         very_long_user = "a" * 100
         driver.find_element(By.ID, "name").send_keys("Test")
@@ -367,14 +356,13 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_019_01_exceed_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_019_02_result")
     
     def test_TC_REG_020_password_very_long(self, driver, base_url):
         """TC_REG_020: Verify handling of very long password (300 chars)"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         long_pass = "a" * 300
         driver.find_element(By.ID, "name").send_keys("Test")
@@ -384,8 +372,7 @@ class TestRegisterBoundaryValue:
         driver.find_element(By.ID, "InputRePassword").send_keys(long_pass)
         screenshot(driver, "TC_REG_020_01_long_pass")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_020_02_result")
 
 
@@ -395,7 +382,7 @@ class TestRegisterSecurity:
     def test_TC_REG_021_sql_injection_name(self, driver, base_url):
         """TC_REG_021: Verify SQL injection protection in name"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("' OR '1'='1")
         driver.find_element(By.ID, "InputEmail").send_keys("sql@test.com")
@@ -404,14 +391,13 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_021_01_sqli_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_021_02_result")
     
     def test_TC_REG_022_sql_injection_username(self, driver, base_url):
         """TC_REG_022: Verify SQL injection protection in username"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test")
         driver.find_element(By.ID, "InputEmail").send_keys("sql@test.com")
@@ -420,14 +406,13 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_022_01_sqli_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_022_02_result")
     
     def test_TC_REG_023_sql_injection_email(self, driver, base_url):
         """TC_REG_023: Verify SQL injection protection in email"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test")
         driver.find_element(By.ID, "InputEmail").send_keys("test@test.com'; DELETE FROM users;--")
@@ -436,14 +421,13 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_023_01_sqli_email")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_023_02_result")
     
     def test_TC_REG_024_xss_name(self, driver, base_url):
         """TC_REG_024: Verify XSS protection in name"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("<script>alert('XSS')</script>")
         driver.find_element(By.ID, "InputEmail").send_keys("xss@test.com")
@@ -452,8 +436,7 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_024_01_xss_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_024_02_result")
         
         try:
@@ -466,7 +449,7 @@ class TestRegisterSecurity:
     def test_TC_REG_025_xss_username(self, driver, base_url):
         """TC_REG_025: Verify XSS protection in username"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("Test")
         driver.find_element(By.ID, "InputEmail").send_keys("xss2@test.com")
@@ -475,14 +458,13 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_025_01_xss_user")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_025_02_result")
     
     def test_TC_REG_026_html_injection(self, driver, base_url):
         """TC_REG_026: Verify HTML injection protection"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         driver.find_element(By.ID, "name").send_keys("<b>Bold</b><h1>Header</h1>")
         driver.find_element(By.ID, "InputEmail").send_keys("html@test.com")
@@ -491,20 +473,19 @@ class TestRegisterSecurity:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_026_01_html")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_026_02_result")
 
 
 class TestRegisterSpecialCharacters:
     """TC_REG_027 - TC_REG_029: Special Characters Tests"""
     
-    def test_TC_REG_027_name_special_chars(self, driver, base_url):
+    def test_TC_REG_027_name_special_chars(self, driver, base_url, unique_names):
         """TC_REG_027: Verify handling special chars in name"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"spec{int(time.time())}"
+        unique = unique_names.username("spec")
         driver.find_element(By.ID, "name").send_keys("John O'Brien-Smith Jr.")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -512,16 +493,15 @@ class TestRegisterSpecialCharacters:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_027_01_special_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_027_02_result")
     
-    def test_TC_REG_028_username_underscore_dash(self, driver, base_url):
+    def test_TC_REG_028_username_underscore_dash(self, driver, base_url, unique_names):
         """TC_REG_028: Verify common username characters"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"john_doe-{int(time.time())}"
+        unique = unique_names.username("john_doe-")
         driver.find_element(By.ID, "name").send_keys("John Doe")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -529,16 +509,15 @@ class TestRegisterSpecialCharacters:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_028_01_underscore_dash")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_028_02_result")
     
-    def test_TC_REG_029_password_all_special(self, driver, base_url):
+    def test_TC_REG_029_password_all_special(self, driver, base_url, unique_names):
         """TC_REG_029: Verify strong password accepted"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"strong{int(time.time())}"
+        unique = unique_names.username("strong")
         driver.find_element(By.ID, "name").send_keys("Test")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -546,8 +525,7 @@ class TestRegisterSpecialCharacters:
         driver.find_element(By.ID, "InputRePassword").send_keys("P@$$w0rd!@#$%^&*()")
         screenshot(driver, "TC_REG_029_01_strong_pass")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_029_02_result")
 
 
@@ -557,12 +535,11 @@ class TestRegisterUsability:
     def test_TC_REG_030_navigation_to_login(self, driver, base_url):
         """TC_REG_030: Verify link to login page works"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         screenshot(driver, "TC_REG_030_01_register_page")
         
         login_link = driver.find_element(By.LINK_TEXT, "Login")
-        login_link.click()
-        time.sleep(1)
+        click_and_wait(driver, login_link, replaces=1)
         screenshot(driver, "TC_REG_030_02_redirected")
         
         assert "login.php" in driver.current_url
@@ -570,14 +547,14 @@ class TestRegisterUsability:
     def test_TC_REG_031_tab_order(self, driver, base_url):
         """TC_REG_031: Verify logical tab order"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         name_field = driver.find_element(By.ID, "name")
         name_field.click()
         screenshot(driver, "TC_REG_031_01_focus_name")
         
         name_field.send_keys(Keys.TAB)
-        time.sleep(0.3)
+        wait_until(driver, focus_on("InputEmail"), replaces=0.3)
         screenshot(driver, "TC_REG_031_02_tab_email")
         
         active = driver.switch_to.active_element
@@ -586,7 +563,7 @@ class TestRegisterUsability:
     def test_TC_REG_032_form_labels(self, driver, base_url):
         """TC_REG_032: Verify all fields have labels"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         screenshot(driver, "TC_REG_032_01_labels")
         
         labels = driver.find_elements(By.TAG_NAME, "label")
@@ -595,7 +572,7 @@ class TestRegisterUsability:
     def test_TC_REG_033_placeholder_text(self, driver, base_url):
         """TC_REG_033: Verify placeholder text is helpful"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         screenshot(driver, "TC_REG_033_01_placeholders")
         
         name_field = driver.find_element(By.ID, "name")
@@ -605,10 +582,9 @@ class TestRegisterUsability:
     def test_TC_REG_034_error_visibility(self, driver, base_url):
         """TC_REG_034: Verify error messages are visible"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_034_01_error_visible")
         
         page_source = driver.page_source.lower()
@@ -618,12 +594,12 @@ class TestRegisterUsability:
 class TestRegisterBugVerification:
     """TC_REG_035 - TC_REG_036: Bug Verification Tests"""
     
-    def test_TC_REG_035_bug_variable_mismatch(self, driver, base_url):
+    def test_TC_REG_035_bug_variable_mismatch(self, driver, base_url, unique_names):
         """TC_REG_035: BUG - $nama vs $name variable mismatch"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
-        unique = f"bugtest{int(time.time())}"
+        unique = unique_names.username("bugtest")
         driver.find_element(By.ID, "name").send_keys("This Name Should Be Saved")
         driver.find_element(By.ID, "InputEmail").send_keys(f"{unique}@test.com")
         driver.find_element(By.ID, "username").send_keys(unique)
@@ -631,15 +607,14 @@ class TestRegisterBugVerification:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_035_01_bug_nama_name")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_035_02_result")
         # Note: Name field will be empty in DB due to $nama vs $name bug
     
     def test_TC_REG_036_bug_wrong_duplicate_check(self, driver, base_url):
         """TC_REG_036: BUG - cek_nama checks wrong field"""
         driver.get(f"{base_url}/register.php")
-        time.sleep(1)
+        wait_for_page_load(driver)
         
         # Name matches existing USERNAME (irul), but our username is unique
         driver.find_element(By.ID, "name").send_keys("irul")
@@ -649,8 +624,7 @@ class TestRegisterBugVerification:
         driver.find_element(By.ID, "InputRePassword").send_keys("password")
         screenshot(driver, "TC_REG_036_01_wrong_check")
         
-        driver.find_element(By.NAME, "submit").click()
-        time.sleep(2)
+        submit_and_wait(driver)
         screenshot(driver, "TC_REG_036_02_result")
         # BUG: Shows "Username sudah terdaftar" even though username is unique
 
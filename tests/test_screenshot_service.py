@@ -0,0 +1,90 @@
+"""
+Unit tests for screenshot_service.py: capture policies and the content store
+"""
+import base64
+import os
+
+import pytest
+
+from screenshot_service import ContentStore, ScreenshotService
+
+
+class FakeCapturingDriver:
+    """Returns a fixed base64 screenshot payload"""
+    PNG = b'\x89PNG\r\n\x1a\nfake'
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(self.PNG).decode()
+
+
+@pytest.mark.stub
+class TestScreenshotService:
+    """Background decoding and writing of screenshots"""
+
+    def test_screenshots_written_after_flush(self, tmp_path):
+        service = ScreenshotService(workers=2, max_queue=4)
+        service.begin("test_x")
+        paths = [str(tmp_path / "sub" / f"shot_{i}.png") for i in range(10)]
+        for path in paths:
+            service.capture(FakeCapturingDriver(), path)
+        service.close()
+
+        assert service.written == 10 and not service.errors
+        assert all(open(path, 'rb').read() == FakeCapturingDriver.PNG for path in paths)
+        assert service.blocked["test_x"] >= 0
+
+    def test_on_failure_writes_only_failing_tests(self, tmp_path):
+        service = ScreenshotService(policy='on-failure', buffer_size=2)
+        service.begin("test_passes")
+        service.capture(FakeCapturingDriver(), str(tmp_path / "pass.png"))
+        service.begin("test_fails")
+        for i in range(3):
+            service.capture(FakeCapturingDriver(), str(tmp_path / f"fail_{i}.png"))
+        service.test_failed()
+        service.close()
+
+        assert sorted(os.listdir(tmp_path)) == ["fail_1.png", "fail_2.png"]
+
+    def test_sampled_and_off_policies(self, tmp_path):
+        service = ScreenshotService(policy='sampled', sample_rate=0.5)
+        test_ids = [f"test_{i}" for i in range(40)]
+        for test_id in test_ids:
+            service.begin(test_id)
+            service.capture(FakeCapturingDriver(), str(tmp_path / f"{test_id}.png"))
+        service.close()
+        sampled = [t for t in test_ids if service.is_sampled(t)]
+        assert 0 < service.written == len(sampled) < len(test_ids)
+
+        service = ScreenshotService(policy='off')
+        service.begin("test_off")
+        service.capture(FakeCapturingDriver(), str(tmp_path / "off.png"))
+        service.close()
+        assert service.captures == 0 and not (tmp_path / "off.png").exists()
+
+
+@pytest.mark.stub
+class TestContentStore:
+    """Deduplicated screenshot storage with run retention"""
+
+    def test_identical_images_stored_once(self, tmp_path):
+        store = ContentStore(str(tmp_path), run_id="run1")
+        first = store.put(str(tmp_path / "login" / "TC_1_page.png"), b"same")
+        second = store.put(str(tmp_path / "login" / "TC_2_page.png"), b"same")
+
+        assert first == second
+        assert store.stored == 1 and store.deduplicated == 1
+        assert store.manifest == {"login/TC_1_page": first, "login/TC_2_page": first}
+
+    def test_prune_keeps_last_runs(self, tmp_path):
+        digests = []
+        for index in range(3):
+            store = ContentStore(str(tmp_path), run_id=f"run{index}")
+            digests.append(store.put(str(tmp_path / "shot.png"), f"image {index}".encode()))
+            path = store.save_manifest()
+            os.utime(path, (index, index))
+
+        removed = ContentStore(str(tmp_path)).prune(keep_runs=2)
+
+        assert removed == 1
+        assert not os.path.exists(store.object_path(digests[0]))
+        assert os.path.exists(store.object_path(digests[2]))
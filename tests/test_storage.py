@@ -0,0 +1,146 @@
+"""
+Unit tests for storage.py: SQL backends and login.php's password lookup
+"""
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+
+import pytest
+
+from conftest import LoginDriver, SYNTH
+from storage import PASSWORD_HASH_QUERY, SQLiteStore, SQLStore, open_store, read_schema, sqlite_schema
+
+
+class CountingStore:
+    """Store proxy recording the name of every store method called"""
+    def __init__(self, store):
+        self._store = store
+        self.calls = []
+
+    def __getattr__(self, name):
+        attribute = getattr(self._store, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            return attribute(*args, **kwargs)
+        return call
+
+
+@pytest.mark.stub
+class TestStorageBackends:
+    """memory and SQLite stores behave alike"""
+
+    @pytest.fixture(params=['memory', 'sqlite'])
+    def store(self, request):
+        store = open_store(request.param)
+        yield store
+        store.close()
+
+    def test_interface(self, store):
+        assert len(store) == 2
+        assert store.get_user('irul')['email'] == 'irul@irul.com'
+        assert store.get_user_by_id(2).username == 'ahmad'
+        assert store.get_user_by_email('ahmad@ahmad.com').id == 2
+        assert store.get_user('IRUL').id == 1 and not store.user_exists('nobody')
+        assert store.add_user('newuser', '', 'new@test.com', 'hash')
+        assert not store.add_user('newuser', '', 'other@test.com', 'hash')
+        assert not store.add_user('other', '', 'NEW@test.com ', 'hash')
+        assert store.get_user('newuser').id == 3
+
+    def test_fork_restore_and_bulk_load(self, store):
+        fork = store.fork()
+        fork.add_user('temp', '', 'temp@test.com', 'hash')
+        assert fork.bulk_load([dict(SYNTH, id=10, username='bulk'), dict(SYNTH, id=11, username='irul')]) == 1
+        assert len(fork) == 4
+        fork.restore()
+        assert len(store) == 2 and store.get_user('bulk') is None
+
+    def test_shared_sqlite_file_keeps_other_writers_rows(self, tmp_path):
+        path = str(tmp_path / "users.db")
+        mine, other = SQLiteStore(path), SQLiteStore(path)
+        fork = mine.fork()
+        assert fork.add_user('forked', '', 'forked@test.com', 'hash')
+        assert other.add_user('other', '', 'other@test.com', 'hash')
+        fork.restore()
+        assert mine.get_user('forked') is None and mine.get_user('other') is not None
+
+        assert mine.add_user('mine', '', 'mine@test.com', 'hash')
+        mine.clear_test_users()
+        assert mine.get_user('mine') is None
+        assert len(mine) == 3 and mine.get_user('irul') and mine.get_user('other')
+        mine.close()
+        other.close()
+
+    def test_concurrent_add_user_is_atomic(self, store):
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda i: store.add_user('race', '', f'r{i}@test.com', 'hash'), range(32)))
+        assert sum(results) == 1 and len(store) == 3
+
+    def test_binary_collation(self):
+        for store in (open_store('memory', 'binary'), open_store('sqlite', 'binary')):
+            assert store.get_user('IRUL ') is None
+            assert store.add_user('Ahmad', '', 'Ahmad@ahmad.com', 'hash')
+            assert not store.add_user('Ahmad', '', 'a@test.com', 'hash')
+
+    def test_sqlite_error_rolls_back(self):
+        store = SQLiteStore()
+        with pytest.raises(sqlite3.Error):
+            store.add_user(object(), '', 'bad@test.com', 'hash')  # unbindable parameter
+        with store.pool.connection() as conn:
+            assert not conn.in_transaction
+        assert store.add_user('after', '', 'after@test.com', 'hash')
+        with pytest.raises(TypeError):
+            SQLStore('binary', store.pool)  # add_user/_insert_many are abstract
+        store.close()
+
+    def test_sqlite_schema_from_dump(self, tmp_path):
+        schema = sqlite_schema(read_schema())
+        assert "id INTEGER PRIMARY KEY AUTOINCREMENT" in schema
+        assert "username TEXT NOT NULL COLLATE general_ci CHECK (length(username) <= 50)" in schema
+        assert "CREATE UNIQUE INDEX IF NOT EXISTS uniq_users_email ON users (email)" in schema
+        assert "INDEX" not in sqlite_schema(read_schema(), indexes=False)
+        store = SQLiteStore(str(tmp_path / "users.db"))
+        # VARCHAR(50) overflow is rejected like MySQL strict mode
+        assert not store.add_user('u' * 51, '', 'long@test.com', 'hash')
+        assert len(store) == 2
+        store.close()
+
+
+@pytest.mark.stub
+class TestLoginQuery:
+    """login.php's lookup: one indexed, single-column query per attempt"""
+
+    @pytest.fixture(params=['memory', 'sqlite'])
+    def store(self, request):
+        store = open_store(request.param)
+        yield store
+        store.close()
+
+    def test_one_lookup_per_attempt(self, store):
+        counting = CountingStore(store)
+        driver = LoginDriver(counting)
+        assert driver.attempt_login("", "irul123")['error'] == 'Data tidak boleh kosong !!'
+        assert counting.calls == []
+        for username, password in [("irul", "irul123"), ("irul", "wrong"), ("ghost", "x")]:
+            counting.calls.clear()
+            driver.attempt_login(username, password)
+            assert counting.calls == ['get_password_hash']
+        assert store.get_password_hash("ghost") is None
+        assert store.get_password_hash("IRUL") == store.get_user("irul").password
+
+    def test_sqlite_runs_one_indexed_statement_per_attempt(self):
+        store = SQLiteStore()
+        statements = []
+        with store.pool.connection() as conn:
+            conn.set_trace_callback(statements.append)
+        driver = LoginDriver(store)
+        for username, password in [("irul", "irul123"), ("irul", "wrong"), ("ghost", "x")]:
+            statements.clear()
+            driver.attempt_login(username, password)
+            assert statements == [PASSWORD_HASH_QUERY.replace('?', f"'{username}'")]
+        with store.pool.connection() as conn:
+            conn.set_trace_callback(None)
+            plan = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {PASSWORD_HASH_QUERY}", ("irul",))]
+        assert plan == ["SEARCH users USING INDEX uniq_users_username (username=?)"]
+        store.close()
@@ -0,0 +1,89 @@
+"""
+Unit tests for stub_server.py: the WSGI stand-in for the PHP pages
+"""
+import http.cookiejar
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from conftest import FakeDriver
+from database_stub import DatabaseStub
+from form_client import AuthenticatedSession
+from stub_server import StubServer
+
+
+@pytest.mark.stub
+class TestStubServer:
+    """The WSGI stand-in reproduces the PHP pages"""
+
+    @pytest.fixture
+    def opener(self):
+        return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def post(self, opener, url, **fields):
+        fields.setdefault('submit', '')
+        response = opener.open(url, urllib.parse.urlencode(fields).encode())
+        return response.geturl(), response.read().decode()
+
+    def test_login_page_markup(self, server, opener):
+        page = opener.open(f"{server.url}/login.php").read().decode()
+        assert 'id="username"' in page and 'id="InputPassword"' in page
+        assert 'alert-danger' not in page and '<?' not in page
+
+    def test_login_errors(self, server, opener):
+        _, page = self.post(opener, f"{server.url}/login.php", username='', password='x')
+        assert 'Data tidak boleh kosong !!' in page
+        _, page = self.post(opener, f"{server.url}/login.php", username='nobody', password='x')
+        assert 'Register User Gagal !!' in page
+
+    def test_wrong_password_stays_without_error(self, server, opener):
+        url, page = self.post(opener, f"{server.url}/login.php", username='irul', password='wrong')
+        assert url.endswith('login.php')
+        assert 'alert-danger' not in page
+
+    def test_valid_login_redirects_to_index(self, server, opener):
+        url, _ = self.post(opener, f"{server.url}/login.php", username='irul', password='irul123')
+        assert url.endswith('index.php')
+        assert opener.open(f"{server.url}/login.php").geturl().endswith('index.php')
+
+    def test_authenticated_session_shared_and_injected(self, server, opener):
+        session = AuthenticatedSession(server.url)
+        session_id = session.cookie()
+        assert session.cookie() == session_id and session.logins == 1
+
+        commands = []
+        driver = FakeDriver()
+        driver.execute_cdp_cmd = lambda cmd, params: commands.append((cmd, params))
+        session.inject(driver)
+        assert commands == [('Network.setCookie', {'name': 'PHPSESSID', 'value': session_id,
+                                                   'path': '/', 'url': f"{server.url}/"})]
+
+        request = urllib.request.Request(f"{server.url}/index.php",
+                                         headers={'Cookie': f"PHPSESSID={session_id}"})
+        assert opener.open(request).geturl().endswith('index.php')
+
+    def test_sessions_only_kept_after_login(self, opener):
+        server = StubServer(DatabaseStub()).start()
+        try:
+            for _ in range(20):
+                urllib.request.urlopen(f"{server.url}/login.php").read()
+                self.post(urllib.request.build_opener(), f"{server.url}/login.php", username='irul', password='wrong')
+            assert server.app.sessions == {}
+
+            self.post(opener, f"{server.url}/login.php", username='irul', password='irul123')
+            assert list(server.app.sessions.values()) == [{'username': 'irul'}]
+            opener.open(f"{server.url}/logout.php").read()
+            assert server.app.sessions == {}
+        finally:
+            server.stop()
+
+    def test_register_password_mismatch(self, server, opener):
+        _, page = self.post(opener, f"{server.url}/register.php", name='A', email='a@b.co',
+                            username='newuser', password='p1', repassword='p2')
+        assert page.count('Password tidak sama !!') == 2
+
+    def test_register_checks_name_instead_of_username(self, server, opener):
+        _, page = self.post(opener, f"{server.url}/register.php", name='irul', email='a@b.co',
+                            username='brandnew', password='p', repassword='p')
+        assert 'Username sudah terdaftar !!' in page
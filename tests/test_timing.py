@@ -0,0 +1,60 @@
+"""
+Unit tests for timing.py: per-test phase timings
+"""
+import pytest
+
+from timing import PhaseTimer
+
+
+class FakeExecutingDriver:
+    """Records the WebDriver commands sent through `execute`"""
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {'value': None}
+
+    def execute_script(self, script, *args):
+        self.execute('w3cExecuteScript')
+        return [1234.5, 40.0]
+
+
+@pytest.mark.stub
+class TestPhaseTimer:
+    """Per-test phase timing"""
+
+    def test_commands_and_phases_attributed(self, tmp_path):
+        timer = PhaseTimer()
+        timer.enabled = True
+        driver = timer.instrument(FakeExecutingDriver())
+        timer.begin("test_x")
+        driver.execute('get')
+        driver.execute('findElement')
+        driver.execute('clickElement')
+        with timer.phase('wait'):
+            driver.execute('findElement')
+            with timer.phase('screenshot'):
+                driver.execute('screenshot')
+        timer.begin(None)
+        timer.finish("test_x", 5.0)
+
+        timing = timer.tests["test_x"]
+        assert timing.commands == 3
+        assert timing.pages == 1 and timing.server == pytest.approx(0.04)
+        assert all(timing.phases[p] > 0 for p in ('navigation', 'lookup', 'interaction', 'wait', 'screenshot'))
+        assert sum(timing.phases.values()) == pytest.approx(5.0)
+
+        timer.write_report(str(tmp_path / "timing.csv"))
+        timer.write_report(str(tmp_path / "timing.json"))
+        assert "test_x" in (tmp_path / "timing.csv").read_text()
+        assert "test_x" in (tmp_path / "timing.json").read_text()
+
+    def test_disabled_timer_records_nothing(self):
+        timer = PhaseTimer()
+        driver = timer.instrument(FakeExecutingDriver())
+        timer.begin("test_x")
+        driver.execute('get')
+        with timer.phase('wait'):
+            pass
+        assert timer.tests == {}
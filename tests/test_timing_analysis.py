@@ -0,0 +1,28 @@
+"""
+Unit tests for timing_analysis.py: login timing statistics
+"""
+import pytest
+
+from timing_analysis import analyze_login_timing, ks_2samp, welch_t_test
+
+
+@pytest.mark.stub
+class TestTimingAnalysis:
+    """Statistics and collection of the login timing analyzer"""
+
+    def test_statistics_on_known_samples(self):
+        same = [1.0, 2.0, 3.0, 4.0, 5.0] * 20
+        shifted = [v + 10 for v in same]
+        assert welch_t_test(same, list(same))[2] == pytest.approx(1.0)
+        assert welch_t_test(same, shifted)[2] < 1e-30
+        # t=-3*sqrt(2), df=18 (equal variances and sizes): two-sided p = 0.000490
+        a, b = [0.0, 2.0] * 5, [2.0, 4.0] * 5
+        assert welch_t_test(a, b)[2] == pytest.approx(0.000490, abs=1e-5)
+        assert ks_2samp(same, shifted) == (1.0, pytest.approx(0.0, abs=1e-20))
+        assert ks_2samp(same, list(same))[1] == 1.0
+
+    def test_stub_login_leaks_user_existence(self, server):
+        # The stub, like login.php, only runs bcrypt for existing users
+        report = analyze_login_timing(server.url, warmup=2, batch=10, max_samples=200, seed=3)
+        assert report.leaks
+        assert len(report.samples['existing_user']) < 200
@@ -0,0 +1,34 @@
+"""
+Unit tests for user_generator.py: synthetic users
+"""
+import pytest
+
+from conftest import LoginDriver
+from database_stub import DatabaseStub
+from passwords import PasswordVerifier
+from user_generator import SyntheticUsers, write_sql
+
+
+@pytest.mark.stub
+class TestSyntheticUsers:
+    """Generated datasets for the stub and the users table"""
+
+    def test_bulk_load_and_valid_logins(self, tmp_path):
+        users = SyntheticUsers(500, cost=4, distinct_passwords=3, cache_dir=str(tmp_path), processes=2)
+        db = DatabaseStub()
+        assert db.bulk_load(users) == 500
+        assert len(db) == 502
+
+        username = users.username_for(40)
+        assert len(username) == 50 and len(users.email_for(45)) == 50
+        driver = LoginDriver(db, PasswordVerifier())
+        assert driver.attempt_login(username, users.password_for(username))['success']
+        assert (tmp_path / "bcrypt-cost4.tsv").read_text().count("\n") == 3
+
+    def test_sql_output(self, tmp_path):
+        users = SyntheticUsers(25, cost=4, distinct_passwords=2, cache_dir=str(tmp_path), processes=1)
+        sql = (tmp_path / "users.sql")
+        write_sql(users, str(sql), batch_size=10)
+        text = sql.read_text()
+        assert text.count("INSERT INTO `users`") == 3
+        assert "(3, 'Synthetic User 0', 'synth0000000" in text
@@ -0,0 +1,25 @@
+"""
+Unit tests for waits.py: wait statistics
+"""
+import pytest
+
+import waits
+
+
+@pytest.mark.stub
+class TestWaitStats:
+    """Accounting of waited time against the fixed sleeps it replaced"""
+
+    def test_saved_time_per_test(self):
+        stats = waits.WaitStats()
+        stats.record(5.0, 1.0)  # outside a test, ignored
+        stats.begin("test_a")
+        stats.record(0.2, 2.0)
+        stats.record(0.1, 1.0)
+        stats.begin("test_b")
+        stats.record(0.5, 1.0)
+
+        rows = stats.saved()
+        assert [row[0] for row in rows] == ["test_a", "test_b"]
+        assert rows[0][1] == pytest.approx(2.7)
+        assert rows[1][1] == pytest.approx(0.5)
@@ -0,0 +1,10 @@
+"""
+Test cases of TestCase_Complete_81_Tests.xlsx, one per sheet row.
+Rows are parsed by workbook.py (cached between runs) and run through the
+same CaseRunner as test_form_cases.py; rows without form input are skipped.
+"""
+
+
+def test_workbook_case(workbook_case, case_runner):
+    failures = case_runner.run(workbook_case)
+    assert not failures, f"{workbook_case.id} ({workbook_case.description}): " + "; ".join(failures)
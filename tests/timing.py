@@ -0,0 +1,201 @@
+"""
+Per-test phase timing for the Selenium suite.
+
+Splits each test's wall time into phases:
+
+    startup      launching, checking out or resetting the browser (`driver` fixture)
+    navigation   driver.get / back / forward / refresh
+    lookup       find_element(s)
+    interaction  click, send_keys, clear, ...
+    wait         the helpers in waits.py
+    screenshot   screenshot captures
+    driver       any other WebDriver command (current_url, execute_script, ...)
+    other        everything else: test code, fixtures, assertions
+
+`server` is the time between request start and response end taken from the
+browser's navigation timing entry of every page the test loaded. It overlaps
+with navigation/wait rather than adding to them.
+
+WebDriver commands are timed by wrapping `driver.execute`; explicit phases
+(`with TIMINGS.phase('wait'):`) take precedence over the commands they issue.
+Timing is off unless enabled with `--timing-report`.
+"""
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+PHASES = ('startup', 'navigation', 'lookup', 'interaction', 'wait', 'screenshot', 'driver', 'other')
+
+NAVIGATION_COMMANDS = {'get', 'goBack', 'goForward', 'refresh'}
+
+COMMAND_PHASES = {
+    **{command: 'navigation' for command in NAVIGATION_COMMANDS},
+    'findElement': 'lookup',
+    'findElements': 'lookup',
+    'findChildElement': 'lookup',
+    'findChildElements': 'lookup',
+    'getActiveElement': 'lookup',
+    'clickElement': 'interaction',
+    'sendKeysToElement': 'interaction',
+    'clearElement': 'interaction',
+    'submitElement': 'interaction',
+    'actions': 'interaction',
+    'screenshot': 'screenshot',
+    'elementScreenshot': 'screenshot',
+}
+
+_NAVIGATION_TIMING = """
+var entry = performance.getEntriesByType('navigation')[0];
+return entry ? [performance.timeOrigin, entry.responseEnd - entry.requestStart] : null;
+"""
+
+
+class PhaseTimes:
+    """Phase durations of one test"""
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.server = 0.0
+        self.pages = 0
+        self.commands = 0
+        self.total = 0.0
+
+    def as_dict(self):
+        return {'total': self.total, 'phases': dict(self.phases), 'server': self.server,
+                'pages': self.pages, 'commands': self.commands}
+
+
+class PhaseTimer:
+    """Collect phase timings per test; a no-op until `enabled` is set"""
+    def __init__(self):
+        self.enabled = False
+        self.current = None
+        self.tests = {}
+        self._stack = []
+        self._seen_pages = set()
+        self._local = threading.local()
+
+    def begin(self, test_id):
+        self.current = test_id
+        self._stack = []
+        if self.enabled and test_id is not None:
+            self.tests.setdefault(test_id, PhaseTimes())
+
+    def _timing(self):
+        if not self.enabled or self.current is None:
+            return None
+        return self.tests.setdefault(self.current, PhaseTimes())
+
+    def add(self, phase, seconds):
+        timing = self._timing()
+        if timing is not None:
+            timing.phases[phase] += seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Attribute the time spent in the block (minus nested phases) to `name`"""
+        if self._timing() is None:
+            yield
+            return
+        frame = [0.0]  # time taken by nested phases
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += elapsed
+            self.add(name, elapsed - frame[0])
+
+    def finish(self, test_id, duration):
+        """Record the test's wall time (setup + call + teardown) and derive `other`"""
+        timing = self.tests.get(test_id)
+        if timing is None:
+            return
+        timing.total += duration
+        timing.phases['other'] = max(timing.total - sum(
+            seconds for phase, seconds in timing.phases.items() if phase != 'other'), 0.0)
+
+    # -------- WebDriver instrumentation --------
+
+    def instrument(self, driver):
+        """Time every command `driver` executes; safe to call on a reused driver"""
+        if getattr(driver, '_timing_execute', None) is not None:
+            return driver
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            timing = self._timing()
+            if timing is None or self._stack or getattr(self._local, 'busy', False):
+                return execute(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                timing.commands += 1
+                timing.phases[COMMAND_PHASES.get(driver_command, 'driver')] += time.perf_counter() - start
+                if driver_command in NAVIGATION_COMMANDS:
+                    self.record_page(driver)
+
+        driver._timing_execute = execute
+        driver.execute = timed_execute
+        return driver
+
+    def record_page(self, driver):
+        """Add the server time of the page currently loaded, once per page"""
+        timing = self._timing()
+        execute = getattr(driver, '_timing_execute', None)
+        if timing is None or execute is None:
+            return
+        self._local.busy = True
+        try:
+            value = driver.execute_script(_NAVIGATION_TIMING)
+        except Exception:
+            # An open JavaScript alert or a closed window; no page to measure
+            return
+        finally:
+            self._local.busy = False
+        if not value or value[0] in self._seen_pages:
+            return
+        self._seen_pages.add(value[0])
+        timing.server += max(value[1], 0.0) / 1000
+        timing.pages += 1
+
+    # -------- reporting --------
+
+    def phase_totals(self):
+        totals = dict.fromkeys(PHASES, 0.0)
+        totals['server'] = 0.0
+        for timing in self.tests.values():
+            for phase, seconds in timing.phases.items():
+                totals[phase] += seconds
+            totals['server'] += timing.server
+        return totals
+
+    def slowest(self, count=10):
+        """Return [(test_id, PhaseTimes)] for the `count` slowest tests"""
+        rows = sorted(self.tests.items(), key=lambda kv: kv[1].total, reverse=True)
+        return rows[:count]
+
+    def write_report(self, path):
+        """Write the timings as CSV (`.csv`) or JSON (anything else)"""
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['test', 'total', *PHASES, 'server', 'pages', 'commands'])
+                for test_id, timing in self.tests.items():
+                    writer.writerow([test_id, f"{timing.total:.4f}",
+                                     *(f"{timing.phases[phase]:.4f}" for phase in PHASES),
+                                     f"{timing.server:.4f}", timing.pages, timing.commands])
+        else:
+            with open(path, 'w') as f:
+                json.dump({'phases': self.phase_totals(),
+                           'tests': {test_id: timing.as_dict() for test_id, timing in self.tests.items()}},
+                          f, indent=1)
+        return path
+
+
+TIMINGS = PhaseTimer()
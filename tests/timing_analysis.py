@@ -0,0 +1,211 @@
+"""
+Timing side-channel analysis of login.php.
+
+Does the response time of a failed login reveal whether the username
+exists? login.php only runs password_verify() (bcrypt) for existing users,
+so "existing user, wrong password" may be measurably slower than "unknown
+user".
+
+Samples are raw HTTP POSTs on a keep-alive connection without cookies, timed
+from sending the request to reading the whole response (no browser, no
+typing). The two cases are interleaved in random order within each round so
+that drift (warm-up, load on the host) affects both equally. After every
+batch the samples are compared with:
+
+    Welch's t-test   difference of means, on samples cropped at the pooled
+                     `crop` percentile to tame scheduler outliers
+    two-sample KS    any difference between the distributions
+
+Collection stops early once both tests are far below `alpha`, so a clear
+leak is confirmed in a few dozen requests and the full budget is only spent
+when the distributions look alike.
+"""
+import http.client
+import math
+import random
+import time
+from urllib.parse import urlencode, urlsplit
+
+# ==================== STATISTICS ====================
+
+
+def mean_var(values):
+    """Mean and unbiased sample variance"""
+    n = len(values)
+    mean = sum(values) / n
+    var = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
+    return mean, var
+
+
+def _betacf(a, b, x, iterations=300, eps=3e-16):
+    """Continued fraction for the regularized incomplete beta function"""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, iterations + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < eps:
+            break
+    return h
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_t_test(a, b):
+    """Return (t, degrees of freedom, two-sided p-value)"""
+    mean_a, var_a = mean_var(a)
+    mean_b, var_b = mean_var(b)
+    se_a, se_b = var_a / len(a), var_b / len(b)
+    if se_a + se_b == 0:
+        return 0.0, float(len(a) + len(b) - 2), 1.0 if mean_a == mean_b else 0.0
+    t = (mean_a - mean_b) / math.sqrt(se_a + se_b)
+    df = (se_a + se_b) ** 2 / ((se_a ** 2) / (len(a) - 1) + (se_b ** 2) / (len(b) - 1))
+    p = betainc(df / 2.0, 0.5, df / (df + t * t))
+    return t, df, p
+
+
+def ks_2samp(a, b):
+    """Two-sample Kolmogorov-Smirnov test: return (D, asymptotic p-value)"""
+    a, b = sorted(a), sorted(b)
+    n_a, n_b = len(a), len(b)
+    i = j = 0
+    d = 0.0
+    while i < n_a and j < n_b:
+        x = min(a[i], b[j])
+        while i < n_a and a[i] <= x:
+            i += 1
+        while j < n_b and b[j] <= x:
+            j += 1
+        d = max(d, abs(i / n_a - j / n_b))
+    n_e = n_a * n_b / (n_a + n_b)
+    lam = (math.sqrt(n_e) + 0.12 + 0.11 / math.sqrt(n_e)) * d
+    if lam < 1e-3:
+        return d, 1.0
+    p = 2.0 * sum((-1) ** (k - 1) * math.exp(-2.0 * k * k * lam * lam) for k in range(1, 101))
+    return d, min(max(p, 0.0), 1.0)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+# ==================== COLLECTION ====================
+
+class LoginTimer:
+    """Time login.php POSTs over one keep-alive connection"""
+    def __init__(self, base_url, timeout=30):
+        parts = urlsplit(base_url.rstrip('/'))
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self.path = f"{parts.path}/login.php"
+
+    def measure(self, username, password):
+        """Seconds from sending the POST to reading the full response"""
+        body = urlencode({'username': username, 'password': password, 'submit': ''})
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        if self.connection.sock is None:
+            # Connection setup is not part of the measurement
+            self.connection.connect()
+        start = time.perf_counter()
+        self.connection.request('POST', self.path, body, headers)
+        response = self.connection.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - start
+        if response.will_close:
+            self.connection.close()
+        return elapsed
+
+    def close(self):
+        self.connection.close()
+
+
+class TimingReport:
+    """Outcome of comparing two sets of response times"""
+    def __init__(self, samples, alpha, min_effect, crop):
+        self.samples = samples
+        self.alpha = alpha
+        self.min_effect = min_effect
+        names = list(samples)
+        a, b = samples[names[0]], samples[names[1]]
+        limit = percentile(a + b, crop)
+        self.cropped = {name: [v for v in values if v <= limit] for name, values in samples.items()}
+        self.t, self.df, self.t_p = welch_t_test(*self.cropped.values())
+        self.d, self.ks_p = ks_2samp(a, b)
+        self.medians = {name: percentile(values, 0.5) for name, values in samples.items()}
+        self.effect = abs(self.medians[names[0]] - self.medians[names[1]])
+
+    @property
+    def leaks(self):
+        """Distinguishable distributions with a practically relevant gap"""
+        return (self.t_p < self.alpha or self.ks_p < self.alpha) and self.effect >= self.min_effect
+
+    def summary(self):
+        lines = [f"{name}: n={len(values)} median={self.medians[name] * 1000:.2f}ms"
+                 for name, values in self.samples.items()]
+        lines.append(f"Welch t={self.t:.2f} df={self.df:.1f} p={self.t_p:.3g}; "
+                     f"KS D={self.d:.3f} p={self.ks_p:.3g}; median gap {self.effect * 1000:.2f}ms")
+        verdict = "LEAKS user existence" if self.leaks else "no detectable leak"
+        lines.append(f"login.php {verdict} (alpha={self.alpha}, min gap {self.min_effect * 1000:.1f}ms)")
+        return "\n".join(lines)
+
+
+def analyze_login_timing(base_url, existing_user='irul', missing_user='nonexistentuser999999',
+                         password='wrongpassword', max_samples=2000, batch=50, warmup=10,
+                         alpha=1e-3, min_effect=0.0005, crop=0.95, seed=None):
+    """
+    Compare wrong-password logins of `existing_user` with logins of
+    `missing_user`; returns a TimingReport.
+    """
+    rng = random.Random(seed)
+    cases = {
+        'existing_user': (existing_user, password),
+        'missing_user': (missing_user, password),
+    }
+    timer = LoginTimer(base_url)
+    try:
+        for _ in range(warmup):
+            for username, pw in cases.values():
+                timer.measure(username, pw)
+
+        samples = {name: [] for name in cases}
+        report = None
+        while len(samples['existing_user']) < max_samples:
+            for _ in range(batch):
+                order = list(cases)
+                rng.shuffle(order)
+                for name in order:
+                    samples[name].append(timer.measure(*cases[name]))
+            report = TimingReport(samples, alpha, min_effect, crop)
+            # Stop early once the leak is beyond doubt
+            if report.leaks and max(report.t_p, report.ks_p) < alpha / 1000:
+                break
+        return report
+    finally:
+        timer.close()
@@ -0,0 +1,170 @@
+"""
+Synthetic users for DatabaseStub and the MySQL `users` table.
+
+`SyntheticUsers` streams `UserRecord`s: names, usernames (every tenth one
+exactly at the 50-character column limit), emails (some at the 50-character
+limit too) and bcrypt hashes at a configurable cost. Users cycle through a
+fixed set of distinct passwords, so a million-user dataset needs only
+`distinct_passwords` bcrypt hashes. Those are computed in parallel across
+processes and cached on disk per cost, making a large dataset a one-time
+cost.
+
+    users = SyntheticUsers(100_000, cost=4)
+    db.bulk_load(users)
+    users.password_for(users.username_for(42))  # a valid login
+
+Command line:
+
+    python tests/user_generator.py --users 1000000 --sql users.sql
+    python tests/user_generator.py --users 1000000 --tsv users.tsv   # LOAD DATA INFILE
+"""
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from common import CACHE_DIR, FileLock, real_escape_string
+from database_stub import UserRecord
+from passwords import DEFAULT_COST, password_hash
+
+USERNAME_MAX = 50
+EMAIL_MAX = 50
+NAME_MAX = 70
+EMAIL_DOMAIN = 'example.com'
+INSERT_COLUMNS = "(`id`, `name`, `username`, `email`, `password`)"
+
+_NEEDS_ESCAPE = re.compile(r"[\0\n\r\\'\"\x1a]")
+
+
+class HashCache:
+    """bcrypt hashes of plaintext passwords for one cost, persisted as TSV"""
+    def __init__(self, cost=DEFAULT_COST, cache_dir=CACHE_DIR):
+        self.cost = cost
+        self.path = os.path.join(cache_dir, f"bcrypt-cost{cost}.tsv")
+        self.hashes = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    password, _, hashed = line.rstrip('\n').partition('\t')
+                    if hashed:
+                        self.hashes[password] = hashed
+        except FileNotFoundError:
+            pass
+
+    def ensure(self, passwords, processes=None):
+        """Hash the passwords missing from the cache on a process pool and persist them"""
+        missing = [p for p in dict.fromkeys(passwords) if p not in self.hashes]
+        if not missing:
+            return self.hashes
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunksize = max(len(missing) // ((processes or os.cpu_count() or 1) * 4), 1)
+            hashed = list(pool.map(password_hash, missing, [self.cost] * len(missing), chunksize=chunksize))
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with FileLock(f"{self.path}.lock"):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.writelines(f"{p}\t{h}\n" for p, h in zip(missing, hashed))
+        self.hashes.update(zip(missing, hashed))
+        return self.hashes
+
+
+class SyntheticUsers:
+    """Deterministic stream of `count` users with ids from `start_id`"""
+    def __init__(self, count, cost=DEFAULT_COST, distinct_passwords=100, start_id=3,
+                 prefix='synth', cache_dir=CACHE_DIR, processes=None):
+        self.count = count
+        self.cost = cost
+        self.distinct_passwords = distinct_passwords
+        self.start_id = start_id
+        self.prefix = prefix
+        self.cache = HashCache(cost, cache_dir)
+        self.processes = processes
+
+    def username_for(self, index):
+        username = f"{self.prefix}{index:07d}"
+        if index % 10 == 0:
+            username = username.ljust(USERNAME_MAX, 'x')
+        return username
+
+    def email_for(self, index):
+        local = f"{self.prefix}{index:07d}"
+        if index % 10 == 5:
+            local = local.ljust(EMAIL_MAX - len(EMAIL_DOMAIN) - 1, 'x')
+        return f"{local}@{EMAIL_DOMAIN}"
+
+    def plaintext(self, index):
+        return f"Pass{index % self.distinct_passwords:05d}!"
+
+    def password_for(self, username):
+        """Plaintext password of a generated `username`"""
+        return self.plaintext(int(username[len(self.prefix):len(self.prefix) + 7]))
+
+    def passwords(self):
+        return [self.plaintext(i) for i in range(min(self.count, self.distinct_passwords))]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        hashes = self.cache.ensure(self.passwords(), self.processes)
+        for index in range(self.count):
+            yield UserRecord(self.start_id + index, f"Synthetic User {index}"[:NAME_MAX],
+                             self.username_for(index), self.email_for(index),
+                             hashes[self.plaintext(index)])
+
+
+def _sql_value(value):
+    if isinstance(value, int):
+        return str(value)
+    return f"'{real_escape_string(value)}'" if _NEEDS_ESCAPE.search(value) else f"'{value}'"
+
+
+def write_sql(users, path, batch_size=1000):
+    """Write the users as multi-row INSERT statements for the `users` table"""
+    with open(path, 'w', encoding='utf-8') as f:
+        batch = []
+        for user in users:
+            batch.append("\t(" + ", ".join(_sql_value(user[c]) for c in UserRecord.FIELDS) + ")")
+            if len(batch) == batch_size:
+                f.write(f"INSERT INTO `users` {INSERT_COLUMNS} VALUES\n" + ",\n".join(batch) + ";\n")
+                batch = []
+        if batch:
+            f.write(f"INSERT INTO `users` {INSERT_COLUMNS} VALUES\n" + ",\n".join(batch) + ";\n")
+    return path
+
+
+def write_tsv(users, path):
+    """
+    Write the users for
+    LOAD DATA INFILE '<path>' INTO TABLE users (id, name, username, email, password)
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for user in users:
+            f.write("\t".join(str(user[c]) for c in UserRecord.FIELDS) + "\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic users for the users table")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--cost", type=int, default=DEFAULT_COST)
+    parser.add_argument("--distinct-passwords", type=int, default=100)
+    parser.add_argument("--start-id", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--sql", help="Write multi-row INSERT statements to this file")
+    parser.add_argument("--tsv", help="Write a LOAD DATA INFILE file")
+    args = parser.parse_args()
+
+    users = SyntheticUsers(args.users, args.cost, args.distinct_passwords, args.start_id,
+                           processes=args.processes)
+    if args.sql:
+        print(f"Wrote {write_sql(users, args.sql)}")
+    if args.tsv:
+        print(f"Wrote {write_tsv(users, args.tsv)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Event-driven wait helpers for the Selenium tests.
+
+These replace fixed `time.sleep()` pauses after navigation and form
+submission: each helper returns as soon as the browser reaches the expected
+state. Every wait records how long it actually took next to the fixed sleep
+it replaces, so the time saved per test can be reported at session end.
+"""
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnexpectedAlertPresentException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from timing import TIMINGS
+
+DEFAULT_TIMEOUT = 10
+
+
+class WaitStats:
+    """Time spent in waits per test, next to the fixed sleeps they replaced"""
+    def __init__(self):
+        self.current = None
+        self.tests = {}
+
+    def begin(self, test_id):
+        self.current = test_id
+
+    def record(self, waited, replaced):
+        if self.current is None:
+            return
+        entry = self.tests.setdefault(self.current, {'waited': 0.0, 'replaced': 0.0, 'waits': 0})
+        entry['waited'] += waited
+        entry['replaced'] += replaced
+        entry['waits'] += 1
+
+    def saved(self):
+        """Return [(test_id, seconds_saved, waited, replaced)] sorted by savings"""
+        rows = [(test_id, e['replaced'] - e['waited'], e['waited'], e['replaced'])
+                for test_id, e in self.tests.items()]
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+
+
+STATS = WaitStats()
+
+
+# ==================== CONDITIONS ====================
+
+def page_loaded(driver):
+    """Document has finished loading"""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def url_changed_from(fragment):
+    """Current URL no longer contains `fragment` (e.g. 'login.php')"""
+    def condition(driver):
+        return fragment not in driver.current_url
+    return condition
+
+
+def alert_danger_rendered(driver):
+    """The server-side `.alert-danger` box is visible; returns the element"""
+    return EC.visibility_of_element_located((By.CLASS_NAME, "alert-danger"))(driver)
+
+
+def form_rerendered_after_post(old_root):
+    """
+    The page holding `old_root` was replaced by the response to a POST
+    (either the re-rendered form or a redirect target) and has loaded.
+    A JavaScript alert raised by the new page also ends the wait.
+    """
+    def condition(driver):
+        try:
+            return EC.staleness_of(old_root)(driver) and page_loaded(driver)
+        except UnexpectedAlertPresentException:
+            return True
+    return condition
+
+
+def focus_on(element_id):
+    """The element with `element_id` has keyboard focus"""
+    def condition(driver):
+        return driver.switch_to.active_element.get_attribute("id") == element_id
+    return condition
+
+
+# ==================== HELPERS ====================
+
+def wait_until(driver, condition, timeout=DEFAULT_TIMEOUT, replaces=0.0):
+    """WebDriverWait on `condition`, recording the time spent against `replaces` seconds"""
+    start = time.perf_counter()
+    try:
+        with TIMINGS.phase('wait'):
+            return WebDriverWait(driver, timeout).until(condition)
+    finally:
+        STATS.record(time.perf_counter() - start, replaces)
+
+
+def wait_for_page_load(driver, timeout=DEFAULT_TIMEOUT, replaces=1.0):
+    """Wait until the current document has loaded"""
+    return wait_until(driver, page_loaded, timeout, replaces)
+
+
+def _will_submit(driver, element):
+    """False when HTML5 validation will block the form `element` belongs to"""
+    try:
+        return driver.execute_script(
+            "var f = arguments[0].form; return !f || f.checkValidity();", element)
+    except StaleElementReferenceException:
+        return True
+
+
+def _act_and_wait(driver, element, action, timeout, replaces):
+    old_root = driver.find_element(By.TAG_NAME, "html")
+    will_submit = _will_submit(driver, element)
+    action()
+    if not will_submit:
+        # Browser validation keeps the page as it is, nothing to wait for
+        STATS.record(0.0, replaces)
+        return False
+    wait_until(driver, form_rerendered_after_post(old_root), timeout, replaces)
+    TIMINGS.record_page(driver)
+    return True
+
+
+def click_and_wait(driver, element, timeout=DEFAULT_TIMEOUT, replaces=2.0):
+    """
+    Click a submit button or link and wait for the resulting page.
+    Returns False when HTML5 validation blocked the submission.
+    """
+    return _act_and_wait(driver, element, element.click, timeout, replaces)
+
+
+def submit_and_wait(driver, timeout=DEFAULT_TIMEOUT, replaces=2.0):
+    """Click the form's `submit` button and wait for the response page"""
+    return click_and_wait(driver, driver.find_element(By.NAME, "submit"), timeout, replaces)
+
+
+def press_enter_and_wait(driver, element, timeout=DEFAULT_TIMEOUT, replaces=2.0):
+    """Submit the form by pressing Enter in `element` and wait for the response page"""
+    return _act_and_wait(driver, element, lambda: element.send_keys(Keys.ENTER), timeout, replaces)
+
+
+def find_alert_danger(driver, timeout=DEFAULT_TIMEOUT):
+    """Return the visible `.alert-danger` element"""
+    try:
+        return wait_until(driver, alert_danger_rendered, timeout)
+    except TimeoutException:
+        raise NoSuchElementException("No visible .alert-danger element")